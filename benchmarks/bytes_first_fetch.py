@@ -0,0 +1,99 @@
+"""
+Benchmark: parsing `response.text` against the bytes-first `soup_from_response`.
+
+Usage
+-----
+    python benchmarks/bytes_first_fetch.py [url ...]
+
+Without arguments synthetic PTT, UDN and FSC pages are served without a
+charset in the Content-Type header, which is when `response.text` falls back
+to detecting the encoding over the whole body. Pass URLs to fetch real pages
+once and benchmark the parse of the received responses.
+"""
+
+import sys
+import timeit
+import requests
+from crawler.parsing import make_soup, soup_from_response
+
+PTT_PAGE = (
+    '<html><head><meta property="og:title" content="[心得] 測試"></head><body>'
+    '<div id="main-content" class="bbs-screen bbs-content">{body}</div>'
+    "{pushes}</body></html>"
+)
+PTT_PUSH = '<div class="push"><span class="push-tag">推 </span><span class="push-userid">user{i}</span><span class="push-content">: 推推 {i}</span></div>'
+UDN_PAGE = '<html><head><meta charset="utf-8"><link rel="canonical" href="https://udn.com/news/story/7238/1"></head><body><h1>標題</h1><section class="article-content__editor">{body}</section></body></html>'
+FSC_PAGE = '<html><body><ul class="list">{rows}</ul></body></html>'
+FSC_ROW = '<li role="row"><span class="num">{i}</span><span class="unit">銀行局</span><span class="title"><a href="home.jsp?id=96&contentid={i}" title="金管會新聞稿 {i}">x</a></span><span class="date">2024-10-11</span></li>'
+
+
+def build_response(url: str, html: str, content_type: str) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = html.encode("utf-8")
+    return response
+
+
+def synthetic_responses():
+    for lines in (200, 2_000):
+        body = "<br>".join(f"第 {i} 行內文 lorem ipsum" for i in range(lines))
+        pushes = "".join(PTT_PUSH.format(i=i) for i in range(lines // 4))
+        yield f"ptt {lines} lines", build_response(
+            "https://www.ptt.cc/bbs/Test/M.1.A.000.html",
+            PTT_PAGE.format(body=body, pushes=pushes),
+            "text/html",
+        )
+    for paragraphs in (20, 200):
+        body = "".join(f"<p>第 {i} 段新聞內文。</p>" for i in range(paragraphs))
+        yield f"udn {paragraphs} paragraphs", build_response(
+            "https://udn.com/news/story/7238/1",
+            UDN_PAGE.format(body=body),
+            "text/html",
+        )
+    for rows in (15, 100):
+        yield f"fsc listing {rows} rows", build_response(
+            "https://www.fsc.gov.tw/ch/home.jsp?id=96",
+            FSC_PAGE.format(rows="".join(FSC_ROW.format(i=i) for i in range(rows))),
+            "text/html",
+        )
+    yield "no content-type", build_response(
+        "https://udn.com/news/story/7238/2",
+        UDN_PAGE.format(body="<p>內文</p>" * 200),
+        "",
+    )
+
+
+def fetched_responses(urls):
+    for url in urls:
+        yield url, requests.get(url, timeout=10)
+
+
+def main() -> None:
+    responses = (
+        fetched_responses(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_responses()
+    )
+    number = 5
+
+    print(f"{'page':<48}{'text (ms)':>11}{'bytes (ms)':>12}{'saved (ms)':>12}  same")
+    total_saved = pages = 0
+    for name, response in responses:
+        old = timeit.timeit(lambda: make_soup(response.text), number=number) / number
+        new = timeit.timeit(lambda: soup_from_response(response), number=number)
+        new /= number
+        same = make_soup(response.text).get_text() == (
+            soup_from_response(response).get_text()
+        )
+        total_saved += old - new
+        pages += 1
+        print(
+            f"{name[:47]:<48}{old * 1000:>11.2f}{new * 1000:>12.2f}"
+            f"{(old - new) * 1000:>12.2f}  {same}"
+        )
+    if pages:
+        print(f"\nmean time saved per page: {total_saved / pages * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
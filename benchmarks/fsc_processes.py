@@ -0,0 +1,105 @@
+"""
+Regression check: `FSC(processes=N)` must give the same records as threads.
+
+Usage
+-----
+    python benchmarks/fsc_processes.py [pages] [processes]
+
+Synthetic FSC listing and article pages are served from memory, with article
+links in the site's `mcustomize=news_view.jsp&dataserno=...` form. Both modes
+crawl the same categories and the script fails (exit status 1) when their
+records differ or an article is left without content.
+"""
+
+import re
+import sys
+import time
+import requests
+from crawler.fsc import FSC
+from crawler.ratelimit import HostRateLimiter
+
+BASE_URL = "https://www.fsc.gov.tw/ch/"
+URLS = {
+    "新聞稿": BASE_URL + "home.jsp?id=96&parentpath=0,2",
+    "重要公告": BASE_URL + "home.jsp?id=97&parentpath=0,2",
+}
+ROWS = 10
+ROW = '<li role="row"><span class="num">{i}</span><span class="unit">銀行局</span><span class="title"><a href="home.jsp?id={id}&parentpath=0,2&mcustomize=news_view.jsp&dataserno={serno}&dtable=News" title="金管會公告 {serno}">x</a></span><span class="date">2024-10-{day:02d}</span></li>'
+PAGER = '<div class="page"><ul>{links}</ul><span>共 {pages} 頁</span></div>'
+ARTICLE = '<html><body><div class="page-edit"><p>第 {serno} 號公告內文</p><p>附件說明</p></div></body></html>'
+
+
+class MemoryClient:
+    """Serves synthetic FSC pages without network access."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.rate_limiter = HostRateLimiter(default_rate=None)
+
+    def listing(self, category_id: str, page: int) -> str:
+        if page > self.pages:
+            return "<html><body><ul></ul></body></html>"
+        rows = "".join(
+            ROW.format(
+                i=i,
+                id=category_id,
+                serno=f"{category_id}{page:03d}{i:02d}",
+                day=i % 28 + 1,
+            )
+            for i in range(ROWS)
+        )
+        links = "".join(
+            f'<li><a href="home.jsp?id={category_id}&parentpath=0,2&page={p}">{p}</a></li>'
+            for p in range(1, self.pages + 1)
+        )
+        pager = PAGER.format(links=links, pages=self.pages)
+        return f'<html><body><ul class="list">{rows}</ul>{pager}</body></html>'
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        serno = re.search(r"dataserno=(\d+)", url)
+        if serno:
+            html = ARTICLE.format(serno=serno.group(1))
+        else:
+            page = re.search(r"[?&]page=(\d+)", url)
+            category_id = re.search(r"[?&]id=(\d+)", url).group(1)
+            html = self.listing(category_id, int(page.group(1)) if page else 1)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response._content = html.encode("utf-8")
+        return response
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    client = MemoryClient(pages)
+
+    results = {}
+    for name, mode in (("threads", None), (f"processes ({processes})", processes)):
+        start = time.perf_counter()
+        results[name] = list(FSC(URLS, client=client, processes=mode).iter_articles())
+        print(
+            f"{name}: {len(results[name])} articles in {time.perf_counter() - start:.2f} s"
+        )
+
+    threads, processed = results.values()
+    failures = []
+    if processed != threads:
+        failures.append("processes mode records differ from threads mode")
+    expected = len(URLS) * pages * ROWS
+    for name, articles in results.items():
+        if len(articles) != expected:
+            failures.append(f"{name}: {len(articles)} of {expected} articles")
+        missing = sum(article["content"] is None for article in articles)
+        if missing:
+            failures.append(f"{name}: {missing} articles without content")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Regression check: `import crawler` must stay cheap.
+
+Usage
+-----
+    python benchmarks/import_time.py [budget_ms]
+
+Runs `python -X importtime -c "import crawler"` in a fresh interpreter and
+fails (exit status 1) when the package import takes longer than `budget_ms`
+(default 50) or loads a crawler's heavy dependency. It also checks that
+importing `PTT` alone does not load Selenium.
+"""
+
+import subprocess
+import sys
+
+# Loaded only when the crawler needing them is first used
+HEAVY_MODULES = ("selenium", "webdriver_manager", "bs4", "requests", "lxml")
+
+
+def import_times(statement: str) -> dict:
+    """
+    Parameters
+    ----------
+    statement : str
+        Python statement run in a fresh interpreter.
+
+    Returns
+    -------
+    dict
+        Cumulative import time in microseconds per imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 50.0
+    failures = []
+
+    times = import_times("import crawler")
+    elapsed_ms = times["crawler"] / 1000
+    print(f"import crawler: {elapsed_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    if elapsed_ms > budget_ms:
+        failures.append(f"import crawler took {elapsed_ms:.1f} ms")
+    loaded = [module for module in HEAVY_MODULES if module in times]
+    if loaded:
+        failures.append(f"import crawler loaded {', '.join(loaded)}")
+
+    times = import_times("from crawler import PTT")
+    for module in ("selenium", "webdriver_manager"):
+        if module in times:
+            failures.append(f"from crawler import PTT loaded {module}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: one Mobile01 browser against a pool of headless browsers.
+
+Usage
+-----
+    python benchmarks/mobile01_pool.py [pages] [workers]
+
+Static topic-list pages are written to a temporary directory and loaded via
+`file://` URLs, so no request reaches Mobile01. Requires Chrome and
+chromedriver (resolved with `resolve_driver_path`).
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from crawler.browser import Browser
+from crawler.mobile import Mobile01Crawler
+
+PAGE = """<html><head><title>Mobile01 第 {page} 頁</title></head><body>
+<div class="l-listTable">{rows}</div></body></html>"""
+ROW = '<div class="c-listTableTd__title"><a href="https://www.mobile01.com/topicdetail.php?f=804&t={topic}">主題 {page}-{i}</a></div>'
+
+
+def write_pages(directory: Path, pages: int) -> str:
+    for page in range(1, pages + 1):
+        rows = "".join(
+            ROW.format(page=page, i=i, topic=page * 100 + i) for i in range(30)
+        )
+        (directory / f"page{page}.html").write_text(
+            PAGE.format(page=page, rows=rows), encoding="utf-8"
+        )
+    return (
+        (directory / "page{page}.html").as_uri().replace("%7B", "{").replace("%7D", "}")
+    )
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    with tempfile.TemporaryDirectory() as directory:
+        base_url = write_pages(Path(directory), pages)
+        timings = {}
+        for n in (1, workers):
+            crawler = Mobile01Crawler(
+                1, pages, base_url, browser=Browser(headless=True)
+            )
+            start = time.perf_counter()
+            crawler.get_info(workers=n)
+            timings[n] = time.perf_counter() - start
+            crawler.close()
+            in_order = [article["title"] for article in crawler.article_list] == [
+                f"主題 {page}-{i}" for page in range(1, pages + 1) for i in range(30)
+            ]
+            print(
+                f"{n} browser(s): {timings[n]:.2f} s, "
+                f"{pages / timings[n]:.1f} pages/s, page order kept: {in_order}"
+            )
+    print(f"speedup: {timings[1] / timings[workers]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
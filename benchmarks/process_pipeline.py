@@ -0,0 +1,81 @@
+"""
+Benchmark: thread-only extraction against `ProcessPipeline`.
+
+Usage
+-----
+    python benchmarks/process_pipeline.py [articles]
+
+Synthetic PTT articles are served from memory, so only parsing and
+extraction are measured. Threads are capped at one core by the GIL, while
+the process pipeline should scale close to linearly with the cores.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from crawler.pipeline import ProcessPipeline
+from crawler.ptt import PTT
+from crawler.ratelimit import HostRateLimiter
+
+PAGE = """<html><head><meta property="og:title" content="[心得] 測試 {i}"></head><body>
+<div id="main-content" class="bbs-screen bbs-content"><div class="article-metaline"><span class="article-meta-tag">作者</span><span class="article-meta-value">tester (測試)</span></div><div class="article-metaline"><span class="article-meta-tag">標題</span><span class="article-meta-value">[心得] 測試 {i}</span></div><div class="article-metaline"><span class="article-meta-tag">時間</span><span class="article-meta-value">Fri Oct 11 10:00:00 2024</span></div>
+{body}
+--
+<span class="f2">※ 發信站: 批踢踢實業坊(ptt.cc), 來自: 1.2.3.4 (臺灣)
+</span>{pushes}</div></body></html>"""
+PUSH = '<div class="push"><span class="hl push-tag">推 </span><span class="f3 hl push-userid">user{i}</span><span class="f3 push-content">: 推推 {i}</span><span class="push-ipdatetime"> 10/11 10:00\n</span></div>'
+
+
+class MemoryClient:
+    """Serves synthetic PTT articles without network access."""
+
+    def __init__(self) -> None:
+        body = "\n".join(f"第 {i} 行內文 lorem ipsum" for i in range(300))
+        pushes = "".join(PUSH.format(i=i) for i in range(200))
+        self.page = PAGE.replace("{body}", body).replace("{pushes}", pushes)
+        self.rate_limiter = HostRateLimiter(default_rate=None)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response._content = self.page.replace("{i}", url[-10:]).encode("utf-8")
+        return response
+
+
+def main() -> None:
+    articles = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    client = MemoryClient()
+    urls = [
+        f"https://www.ptt.cc/bbs/Test/M.{1700000000 + i}.A.{i:03X}.html"
+        for i in range(articles)
+    ]
+    ptt = PTT("Test", sleep=None, client=client)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(ptt.fetch_article, urls))
+    baseline = time.perf_counter() - start
+    print(f"{'mode':<28}{'articles/s':>12}{'speedup':>9}")
+    print(f"{'threads (8)':<28}{articles / baseline:>12.1f}{1:>8.1f}x")
+
+    cores = os.cpu_count() or 1
+    for processes in sorted({1, 2, 4, cores}):
+        if processes > cores:
+            continue
+        for chunk_size in (1, 16):
+            with ProcessPipeline(
+                client, processes=processes, chunk_size=chunk_size
+            ) as pipeline:
+                start = time.perf_counter()
+                list(pipeline.run(urls))
+                elapsed = time.perf_counter() - start
+            name = f"processes ({processes}), chunk {chunk_size}"
+            print(f"{name:<28}{articles / elapsed:>12.1f}{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
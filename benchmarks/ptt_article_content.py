@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: `PTT.get_article_content` against the previous regex extractor.
+
+Usage
+-----
+    python benchmarks/ptt_article_content.py [html_dir]
+
+Without arguments a synthetic corpus of large posts is generated. Pass a
+directory of saved PTT article pages (`*.html`) to benchmark real posts.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+from bs4 import BeautifulSoup
+from crawler.ptt import PTT
+
+RE_CONTENT = r"(作者.{1,30}看板.{1,30}標題.{1,30}時間.{1,30}=?)[\s\S]+(?=※ 發信站:)"
+
+PAGE = """<html><head><meta property="og:title" content="[心得] 測試"></head><body>
+<div id="main-content" class="bbs-screen bbs-content"><div class="article-metaline"><span class="article-meta-tag">作者</span><span class="article-meta-value">tester (測試)</span></div><div class="article-metaline-right"><span class="article-meta-tag">看板</span><span class="article-meta-value">Test</span></div><div class="article-metaline"><span class="article-meta-tag">標題</span><span class="article-meta-value">[心得] 測試</span></div><div class="article-metaline"><span class="article-meta-tag">時間</span><span class="article-meta-value">Fri Oct 11 10:00:00 2024</span></div>
+{body}
+--
+{footer}{pushes}</div></body></html>"""
+FOOTER = '<span class="f2">※ 發信站: 批踢踢實業坊(ptt.cc), 來自: 1.2.3.4 (臺灣)\n</span>'
+OLD_FOOTER = '<span class="f2">◆ From: 1.2.3.4\n</span>'
+PUSH = '<div class="push"><span class="hl push-tag">推 </span><span class="f3 hl push-userid">user{i}</span><span class="f3 push-content">: 推推 {i}</span><span class="push-ipdatetime"> 10/11 10:00\n</span></div>'
+QUOTE = ": 作者 user{i} 看板 Test 標題 [新聞] 轉錄 時間 Fri Oct 11 10:00:00 2024"
+
+
+def regex_article_content(soup: BeautifulSoup) -> str:
+    """The extractor `PTT.get_article_content` used before, kept for comparison."""
+    raw_content = soup.find_all("div", attrs={"class": "bbs-screen bbs-content"})[
+        0
+    ].text
+    full_content = meta_info = ""
+    for match in re.finditer(RE_CONTENT, raw_content):
+        full_content = match.group(0)
+        meta_info = match.group(1)
+    return full_content.replace(meta_info, "")
+
+
+def synthetic_corpus():
+    for lines in (1_000, 10_000, 50_000):
+        body = "\n".join(f"第 {i} 行內文 lorem ipsum" for i in range(lines))
+        pushes = "".join(PUSH.format(i=i) for i in range(lines // 10))
+        yield f"normal {lines} lines", PAGE.format(
+            body=body, footer=FOOTER, pushes=pushes
+        )
+    for lines in (100, 200, 400):
+        # 舊格式沒有「※ 發信站:」，引用大量標頭時 regex 會反覆回溯
+        body = "\n".join(QUOTE.format(i=i) for i in range(lines))
+        yield f"quoted headers {lines} lines, no signature", PAGE.format(
+            body=body, footer=OLD_FOOTER, pushes=""
+        )
+
+
+def file_corpus(directory: str):
+    for path in sorted(Path(directory).glob("*.html")):
+        yield path.name, path.read_text(encoding="utf-8")
+
+
+def main() -> None:
+    corpus = file_corpus(sys.argv[1]) if len(sys.argv) > 1 else synthetic_corpus()
+
+    print(f"{'post':<42}{'regex (ms)':>12}{'linear (ms)':>13}{'speedup':>9}  same")
+    for name, html in corpus:
+        soup = BeautifulSoup(html, "html.parser")
+        number = 1 if "no signature" in name else 3
+        old = timeit.timeit(lambda: regex_article_content(soup), number=number)
+        new = timeit.timeit(lambda: PTT.get_article_content(soup), number=number)
+        same = regex_article_content(soup) == PTT.get_article_content(soup)
+        print(
+            f"{name:<42}{old / number * 1000:>12.2f}{new / number * 1000:>13.2f}"
+            f"{old / new:>8.1f}x  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,56 @@
-from .fsc import FSC
-from .udn import UDN
-from .tvbs import TVBS
-from .mobile import Mobile01Crawler
-from .ptt import PTT
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodule defining them. They are imported on first
+# access, so e.g. `from crawler import PTT` never loads Selenium.
+_EXPORTS = {
+    "FSC": ".fsc",
+    "UDN": ".udn",
+    "TVBS": ".tvbs",
+    "Mobile01Crawler": ".mobile",
+    "Browser": ".browser",
+    "BrowserPool": ".browser",
+    "PTT": ".ptt",
+    "MultiBoardPTT": ".ptt",
+    "HttpClient": ".transport",
+    "get_default_client": ".transport",
+    "set_default_client": ".transport",
+    "HostRateLimiter": ".ratelimit",
+    "HttpCache": ".cache",
+    "ResponseArchive": ".archive",
+    "ProcessPipeline": ".pipeline",
+    "JsonStore": ".store",
+    "JsonlSink": ".sinks",
+    "ParquetSink": ".sinks",
+    "open_sink": ".sinks",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .fsc import FSC
+    from .udn import UDN
+    from .tvbs import TVBS
+    from .mobile import Mobile01Crawler
+    from .browser import Browser, BrowserPool
+    from .ptt import PTT, MultiBoardPTT
+    from .transport import HttpClient, get_default_client, set_default_client
+    from .ratelimit import HostRateLimiter
+    from .cache import HttpCache
+    from .archive import ResponseArchive
+    from .pipeline import ProcessPipeline
+    from .store import JsonStore
+    from .sinks import JsonlSink, ParquetSink, open_sink
@@ -0,0 +1,165 @@
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+from .sinks import JsonlSink
+
+
+class ResponseArchive:
+    """
+    Archive of the raw responses seen while crawling.
+
+    Each response is one JSON Lines record holding the URL, status, headers,
+    fetch time and the base64 encoded body. The records are written through a
+    `JsonlSink`, so `.jsonl.zst` and `.jsonl.gz` paths are compressed and
+    later runs append to the same archive. `python -m crawler.reextract` runs
+    the extractors over an archive without network access.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Archive file, compressed by its extension (`.zst` for zstd,
+            `.gz` for gzip).
+        batch_size : int, optional
+            Number of buffered responses that triggers a flush, by default 100.
+        flush_interval : float, optional
+            Maximum seconds between flushes, by default 5.
+        """
+        name = str(path)
+        compression = None
+        if name.endswith(".zst"):
+            compression = "zstd"
+        elif name.endswith(".gz"):
+            compression = "gzip"
+        self.sink = JsonlSink(path, compression, batch_size, flush_interval)
+        self.lock = threading.Lock()
+
+    def record(
+        self, url: str, response: requests.Response, meta: Optional[Dict] = None
+    ) -> None:
+        """
+        Append a response to the archive.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+        response : requests.Response
+            The response, including its body.
+        meta : Optional[Dict], optional
+            Crawl context the page alone does not hold, e.g. the category of
+            an FSC listing page, by default None.
+        """
+        record = {
+            "url": url,
+            "final_url": response.url,
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "fetched_at": time.time(),
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        if meta:
+            record["meta"] = meta
+        with self.lock:
+            self.sink.write(record)
+
+    def close(self) -> None:
+        """Flush the buffered responses and close the file."""
+        with self.lock:
+            self.sink.close()
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_archive(path: Union[str, Path], latest_only: bool = False) -> Iterator[Dict]:
+    """
+    Read the records of an archive, with the body decoded back to bytes.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Archive written by `ResponseArchive`.
+    latest_only : bool, optional
+        Skip every record of a URL archived again later, e.g. by a later
+        run appending to the same archive, by default False. The archive is
+        then read twice.
+
+    Returns
+    -------
+    Iterator[Dict]
+        Archived responses in the order they were fetched. A partial last
+        line left by an interrupted run is skipped.
+    """
+    latest = None
+    if latest_only:
+        latest = {
+            record["url"]: index for index, record in enumerate(_read_lines(path))
+        }
+    for index, record in enumerate(_read_lines(path)):
+        if latest is not None and latest[record["url"]] != index:
+            continue
+        record["body"] = base64.b64decode(record["body"])
+        yield record
+
+
+def _read_lines(path: Union[str, Path]) -> Iterator[Dict]:
+    name = str(path)
+    if name.endswith(".zst"):
+        import zstandard
+
+        raw = open(path, "rb")
+        f = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        )
+    elif name.endswith(".gz"):
+        f = gzip.open(path, "rb")
+    else:
+        f = open(path, "rb")
+
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            yield record
+
+
+def to_response(record: Dict) -> requests.Response:
+    """
+    Rebuild a response from an archived record, e.g. for `soup_from_response`.
+
+    Parameters
+    ----------
+    record : Dict
+        Record yielded by `iter_archive`.
+
+    Returns
+    -------
+    requests.Response
+        The archived response.
+    """
+    response = requests.Response()
+    response.status_code = record["status"]
+    response.url = record["final_url"]
+    response.headers = CaseInsensitiveDict(record["headers"])
+    response._content = record["body"]
+    return response
@@ -0,0 +1,272 @@
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Union
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from .store import JsonStore
+
+DRIVER_CACHE = Path.home() / ".cache" / "crawler" / "chromedriver.json"
+# Network.setBlockedURLs patterns: stylesheets, web fonts and third-party
+# scripts (ads, analytics, social widgets) that do not affect the DOM we read
+BLOCKED_URLS = [
+    "*.css",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*adservice.google.*",
+    "*facebook.net*",
+    "*facebook.com/plugins*",
+    "*scorecardresearch.com*",
+    "*criteo.*",
+    "*clarity.ms*",
+]
+
+
+def resolve_driver_path(
+    cache_path: Union[str, Path] = DRIVER_CACHE, refresh: bool = False
+) -> str:
+    """
+    Return the chromedriver path, downloading it only when needed.
+
+    `ChromeDriverManager().install()` checks the installed Chrome version and
+    the driver releases on every call. The resolved path is cached in a
+    `JsonStore` and reused for as long as the file exists, or until Chrome
+    rejects it and `Browser.start` asks for a `refresh`.
+
+    Parameters
+    ----------
+    cache_path : Union[str, Path], optional
+        Store holding the resolved path, by default
+        `~/.cache/crawler/chromedriver.json`.
+    refresh : bool, optional
+        Ignore the cached path and resolve the driver again, e.g. after a
+        Chrome update, by default False.
+
+    Returns
+    -------
+    str
+        Path of the chromedriver executable.
+    """
+    store = JsonStore(cache_path)
+    path = store.get("chromedriver")
+    if path and not refresh and os.access(path, os.X_OK):
+        return path
+    if path:
+        # Forget the stale path even if resolving the new one fails
+        store.set("chromedriver", None)
+        store.save()
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    store.set("chromedriver", path)
+    store.save()
+    return path
+
+
+class Browser:
+    """
+    Chrome instance started on first use and shareable between crawlers.
+
+    Creating a `Browser` is free. Chrome is launched the first time `driver`
+    is accessed, and keeps running until `quit`, so one browser can serve
+    several `Mobile01Crawler` instances or forums in a row.
+
+    Pages load with the "eager" strategy, so `driver.get` returns once the
+    DOM is ready instead of waiting for every subresource, and stylesheets,
+    fonts and third-party scripts are blocked through the DevTools protocol.
+    """
+
+    def __init__(
+        self,
+        arguments: Optional[List[str]] = None,
+        driver_path: Optional[str] = None,
+        page_load_strategy: str = "eager",
+        blocked_urls: Optional[List[str]] = None,
+        headless: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        arguments : Optional[List[str]], optional
+            Extra Chrome command-line arguments.
+        driver_path : Optional[str], optional
+            chromedriver executable, by default `resolve_driver_path()`.
+        page_load_strategy : str, optional
+            "normal", "eager" or "none", by default "eager".
+        blocked_urls : Optional[List[str]], optional
+            URL patterns never requested, by default `BLOCKED_URLS`. Pass an
+            empty list to load everything.
+        headless : bool, optional
+            Run Chrome without a window, by default False.
+        """
+        self.arguments = arguments or []
+        self.driver_path = driver_path
+        self.page_load_strategy = page_load_strategy
+        self.blocked_urls = BLOCKED_URLS if blocked_urls is None else blocked_urls
+        self.headless = headless
+        self.lock = threading.Lock()
+        self._driver = None
+
+    def options(self) -> Options:
+        """
+        Returns
+        -------
+        Options
+            Chrome options the browser is started with.
+        """
+        chrome_options = Options()
+        chrome_options.add_argument("--disable-gpu")  # 禁用 GPU 加速
+        chrome_options.add_argument("--disable-extensions")  # 禁用扩展
+        chrome_options.add_argument(
+            "--blink-settings=imagesEnabled=false"
+        )  # 不加载图片
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+        for argument in self.arguments:
+            chrome_options.add_argument(argument)
+        chrome_options.page_load_strategy = self.page_load_strategy
+        return chrome_options
+
+    def start(self) -> webdriver.Chrome:
+        """
+        Launch Chrome.
+
+        If Chrome refuses the cached chromedriver, e.g. because Chrome has
+        updated itself since it was resolved, the driver is resolved again
+        and the launch retried once.
+
+        Returns
+        -------
+        webdriver.Chrome
+            The new driver.
+        """
+        service = Service(self.driver_path or resolve_driver_path())
+        try:
+            driver = webdriver.Chrome(service=service, options=self.options())
+        except SessionNotCreatedException as e:
+            if self.driver_path:
+                raise
+            print(f"Cached chromedriver rejected, resolving it again: {e.msg}")
+            service = Service(resolve_driver_path(refresh=True))
+            driver = webdriver.Chrome(service=service, options=self.options())
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.blocked_urls}
+            )
+        return driver
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """The running driver, launched on first access."""
+        with self.lock:
+            if self._driver is None:
+                self._driver = self.start()
+            return self._driver
+
+    @property
+    def started(self) -> bool:
+        return self._driver is not None
+
+    def memory_usage(self) -> Optional[int]:
+        """
+        Memory used by the running browser, in bytes.
+
+        With `psutil` installed this is the resident memory of every Chrome
+        process started by the driver, otherwise the JS heap of the page.
+
+        Returns
+        -------
+        Optional[int]
+            Bytes in use, or None if Chrome is not running or the value is
+            unavailable.
+        """
+        if self._driver is None:
+            return None
+        try:
+            import psutil
+        except ImportError:
+            return self._driver.execute_script(
+                "return performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+        try:
+            driver_process = psutil.Process(self._driver.service.process.pid)
+            return sum(
+                child.memory_info().rss
+                for child in driver_process.children(recursive=True)
+            )
+        except (AttributeError, psutil.Error):
+            return None
+
+    def quit(self) -> None:
+        """Close Chrome. The next access to `driver` launches a new one."""
+        with self.lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                finally:
+                    self._driver = None
+
+    def recycle(self) -> None:
+        """
+        Discard a crashed or bloated browser, ignoring errors while closing
+        it. The next access to `driver` launches a new one.
+        """
+        try:
+            self.quit()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+
+    def __enter__(self) -> "Browser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.quit()
+
+
+class BrowserPool:
+    """
+    Fixed set of headless browsers, e.g. for `Mobile01Crawler.get_info`.
+
+    Every browser is launched lazily by the worker using it, and the pool can
+    be kept open and passed to several crawls.
+    """
+
+    def __init__(self, size: int, **browser_options) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            Number of browsers.
+        **browser_options
+            Forwarded to `Browser`, `headless` defaults to True.
+        """
+        browser_options.setdefault("headless", True)
+        self.browsers = [Browser(**browser_options) for _ in range(size)]
+
+    def __len__(self) -> int:
+        return len(self.browsers)
+
+    def __iter__(self):
+        return iter(self.browsers)
+
+    def close(self) -> None:
+        """Close every browser."""
+        for browser in self.browsers:
+            browser.recycle()
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,270 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Seconds a cached page is served without asking the server again, per URL
+# pattern. Pages past their TTL are revalidated with a conditional GET. Only
+# article pages get a TTL, listing and index pages (and PTT articles, whose
+# pushes change all the time) always revalidate through `default_ttl`, so
+# e.g. the latest article ID is never read from a stale listing.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    r"https://news\.tvbs\.com\.tw/[\w-]+/\d+$": 86400.0,
+    r"https://udn\.com/news/story/\d+/\d+$": 86400.0,
+    r"https://www\.fsc\.gov\.tw/ch/home\.jsp\?.*\bdataserno=": 3600.0,
+}
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache with conditional GET revalidation.
+
+    Every cached page is one compressed file holding a JSON header line and
+    the body. A page younger than the TTL of its source is served without a
+    request. An older page is revalidated with `If-None-Match` /
+    `If-Modified-Since`, so an unchanged page costs a 304 instead of the full
+    body. Once the cache grows over `max_size` bytes, the least recently used
+    pages are evicted.
+
+    Attributes
+    ----------
+    path : Path
+        Cache directory.
+    ttls : Dict[str, Optional[float]]
+        TTL in seconds per URL regex, matched from the start of the URL. The
+        first matching pattern wins and a TTL of None disables caching for
+        the matching URLs.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size: int = 512 * 1024 * 1024,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        default_ttl: Optional[float] = 0.0,
+        compression: str = "gzip",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Cache directory, created if needed.
+        max_size : int, optional
+            Total size of the compressed pages in bytes, by default 512 MB.
+        ttls : Optional[Dict[str, Optional[float]]], optional
+            TTL in seconds per URL regex, by default `DEFAULT_TTLS`.
+        default_ttl : Optional[float], optional
+            TTL of URLs matching no prefix, by default 0 (always revalidate).
+        compression : str, optional
+            "gzip" or "zstd" (requires `zstandard`), by default "gzip".
+        """
+        if compression not in ("gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.patterns = [
+            (re.compile(pattern), ttl) for pattern, ttl in self.ttls.items()
+        ]
+        self.default_ttl = default_ttl
+        self.compression = compression
+        if compression == "zstd":
+            import zstandard
+
+            self.compress = zstandard.ZstdCompressor().compress
+            self.decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            self.compress = gzip.compress
+            self.decompress = gzip.decompress
+
+        self.lock = threading.Lock()
+        # file name -> size, least recently used first
+        self.entries: "OrderedDict[str, int]" = OrderedDict()
+        self.size = 0
+        files = [
+            entry
+            for entry in os.scandir(self.path)
+            if entry.is_file() and entry.name.endswith(".cache")
+        ]
+        for entry in sorted(files, key=lambda entry: entry.stat().st_mtime):
+            self.entries[entry.name] = entry.stat().st_size
+            self.size += entry.stat().st_size
+
+    def ttl(self, url: str) -> Optional[float]:
+        """
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+
+        Returns
+        -------
+        Optional[float]
+            TTL in seconds of the first matching pattern, None if the URL is
+            not cached.
+        """
+        for pattern, ttl in self.patterns:
+            if pattern.match(url):
+                return ttl
+        return self.default_ttl
+
+    def file_name(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest() + ".cache"
+
+    def lookup(self, url: str) -> Optional[Tuple[Dict, bytes, bool]]:
+        """
+        Read a cached page.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+
+        Returns
+        -------
+        Optional[Tuple[Dict, bytes, bool]]
+            The stored header, the body and whether the page is still fresh,
+            or None on a miss.
+        """
+        ttl = self.ttl(url)
+        if ttl is None:
+            return None
+        name = self.file_name(url)
+        try:
+            with open(self.path / name, "rb") as f:
+                validated_at = os.fstat(f.fileno()).st_mtime
+                data = self.decompress(f.read())
+        except (OSError, EOFError, ValueError):
+            return None
+        header, _, body = data.partition(b"\n")
+        meta = json.loads(header)
+        if meta["url"] != url:
+            return None
+        with self.lock:
+            if name in self.entries:
+                self.entries.move_to_end(name)
+        return meta, body, time.time() - validated_at < ttl
+
+    def validators(self, meta: Dict) -> Dict[str, str]:
+        """
+        Parameters
+        ----------
+        meta : Dict
+            Header of a cached page.
+
+        Returns
+        -------
+        Dict[str, str]
+            Conditional request headers for revalidating the page.
+        """
+        headers = {}
+        if meta["headers"].get("ETag"):
+            headers["If-None-Match"] = meta["headers"]["ETag"]
+        if meta["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+        return headers
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        Cache a 200 response, evicting old pages when over `max_size`.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+        response : requests.Response
+            Response to cache. Other status codes are ignored.
+        """
+        if response.status_code != 200 or self.ttl(url) is None:
+            return
+        meta = {
+            "url": url,
+            "final_url": response.url,
+            "headers": {
+                name: response.headers[name]
+                for name in KEPT_HEADERS
+                if name in response.headers
+            },
+        }
+        data = self.compress(
+            json.dumps(meta, ensure_ascii=False).encode("utf-8")
+            + b"\n"
+            + response.content
+        )
+        name = self.file_name(url)
+        tmp_path = self.path / f"{name}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path / name)
+
+        with self.lock:
+            self.size += len(data) - self.entries.pop(name, 0)
+            self.entries[name] = len(data)
+            while self.size > self.max_size and len(self.entries) > 1:
+                evicted, size = self.entries.popitem(last=False)
+                self.size -= size
+                try:
+                    os.remove(self.path / evicted)
+                except OSError:
+                    pass
+
+    def touch(self, url: str) -> None:
+        """
+        Mark a cached page as revalidated, e.g. after a 304.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+        """
+        try:
+            os.utime(self.path / self.file_name(url))
+        except OSError:
+            pass
+
+    @staticmethod
+    def build_response(meta: Dict, body: bytes) -> requests.Response:
+        """
+        Rebuild a response from a cached page.
+
+        Parameters
+        ----------
+        meta : Dict
+            Header of the cached page.
+        body : bytes
+            Cached body.
+
+        Returns
+        -------
+        requests.Response
+            A 200 response with `from_cache` set to True.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = meta["final_url"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = body
+        response.from_cache = True
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached page."""
+        with self.lock:
+            for name in self.entries:
+                try:
+                    os.remove(self.path / name)
+                except OSError:
+                    pass
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,114 @@
+import re
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+from .store import JsonStore
+
+
+def latest_id_from_listing(html: str, start_url: str) -> Optional[int]:
+    """
+    Find the newest article ID linked from a section listing page.
+
+    Parameters
+    ----------
+    html : str
+        HTML of the listing page.
+    start_url : str
+        Article URL prefix, e.g. `https://news.tvbs.com.tw/money/`. Links are
+        matched on its path so both absolute and relative hrefs count.
+
+    Returns
+    -------
+    Optional[int]
+        The largest article ID found, or None if the page links to none.
+    """
+    path = urlsplit(start_url).path
+    ids = re.findall(re.escape(path) + r"(\d+)", html)
+    return max(map(int, ids)) if ids else None
+
+
+def probe_latest_id(
+    exists: Callable[[int], bool], known_id: int, window: int = 5
+) -> int:
+    """
+    Find the newest existing ID above a known one with exponential then
+    binary search, using O(log n) probes.
+
+    IDs are assumed to be mostly contiguous. A probe counts as a hit if any
+    of the `window` IDs starting at it exists, so small gaps (deleted or
+    unpublished articles) do not end the search early.
+
+    Parameters
+    ----------
+    exists : Callable[[int], bool]
+        Returns True if the article with this ID exists.
+    known_id : int
+        An ID known to exist.
+    window : int, optional
+        Number of consecutive IDs checked per probe, by default 5.
+
+    Returns
+    -------
+    int
+        The newest ID found to exist.
+    """
+
+    def hit(article_id: int) -> Optional[int]:
+        for candidate in range(article_id, article_id + window):
+            if exists(candidate):
+                return candidate
+        return None
+
+    lo, step = known_id, 1
+    while True:
+        found = hit(lo + step)
+        if found is None:
+            break
+        lo, step = found, step * 2
+    hi = lo + step
+
+    # lo exists, nothing exists within `window` of hi
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        found = hit(mid)
+        if found is not None and found < hi:
+            lo = found
+        else:
+            hi = mid
+    return lo
+
+
+class NegativeCache:
+    """
+    Persisted set of article IDs that were empty or belonged to another
+    section, so later runs skip them without a request.
+    """
+
+    def __init__(self, store: JsonStore, key: str, max_size: int = 100000) -> None:
+        """
+        Parameters
+        ----------
+        store : JsonStore
+            Store the IDs are persisted in.
+        key : str
+            Key of the ID list in the store.
+        max_size : int, optional
+            Number of IDs kept (the largest ones), by default 100000.
+        """
+        self.store = store
+        self.key = key
+        self.max_size = max_size
+        self.ids = set(store.get(key) or [])
+
+    def __contains__(self, article_id: int) -> bool:
+        return article_id in self.ids
+
+    def add(self, article_id: int) -> None:
+        self.ids.add(article_id)
+
+    def update(self, article_ids: Iterable[int]) -> None:
+        self.ids.update(article_ids)
+
+    def save(self) -> None:
+        """Persist the newest `max_size` IDs."""
+        self.store.set(self.key, sorted(self.ids)[-self.max_size :])
+        self.store.save()
@@ -1,13 +1,35 @@
+import re
 import requests
-from bs4 import BeautifulSoup
-import json
-from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, Tag
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional
+from .parsing import soup_from_response
+from .sinks import open_sink
+from .store import JsonStore
+from .transport import HttpClient, get_default_client
+
+if TYPE_CHECKING:
+    from .pipeline import ProcessPipeline
+
+PAGE_PARAM = re.compile(r"[?&]page=(\d+)")
+TOTAL_PAGES = re.compile(r"共\s*(\d+)\s*頁")
+PAGINATION_CLASS = re.compile(r"^(page|pages|pager|pagination|paging)$")
 
 
 class FSC:
     """Crawler for scraping announcements on the Financial Supervisory Commission website."""
 
-    def __init__(self, urls: Dict[str, str], max_pages: Optional[int] = None):
+    def __init__(
+        self,
+        urls: Dict[str, str],
+        max_pages: Optional[int] = None,
+        client: Optional[HttpClient] = None,
+        workers: int = 8,
+        store: Optional[JsonStore] = None,
+        max_seen: int = 5000,
+        processes: Optional[int] = None,
+    ):
         """
         Initialize the FSC Crawler.
 
@@ -17,13 +39,35 @@ class FSC:
             Dictionary containing URL and corresponding category.
         max_pages : Optional[int], optional
             Max pages to scrape, by default None (scrape all pages).
+        client : Optional[HttpClient], optional
+            Shared HTTP client, by default `get_default_client()`.
+        workers : int, optional
+            Number of article pages fetched concurrently, by default 8. The
+            per-host rate limit of the client still applies. Listing pages
+            are fetched with the same number of threads.
+        store : Optional[JsonStore], optional
+            Store of the article links already crawled per category. Known
+            articles are skipped and paging stops at the first listing page
+            without new ones. By default None (crawl everything).
+        max_seen : int, optional
+            Number of links kept per category in `store`, by default 5000.
+        processes : Optional[int], optional
+            Extract the article pages in a `ProcessPipeline` with this many
+            processes, by default None (extract in the fetch threads).
         """
         self.urls = urls
         self.base_url = "https://www.fsc.gov.tw/ch/"
         self.max_pages = max_pages
+        self.client = client or get_default_client()
+        self.workers = workers
+        self.store = store
+        self.max_seen = max_seen
+        self.processes = processes
+        # Listing and article pages share one host, keep the parallel fetches polite
+        self.client.rate_limiter.setdefault(self.base_url, 5, 1)
 
     def fetch_data(
-        self, url: str, page: Optional[int] = None
+        self, url: str, page: Optional[int] = None, category: Optional[str] = None
     ) -> Optional[BeautifulSoup]:
         """
         Fetch webpage content using BeautifulSoup.
@@ -34,6 +78,9 @@ class FSC:
             URL for scraping.
         page : Optional[int], optional
             Page number for scraping, by default None.
+        category : Optional[str], optional
+            Category of a listing page, stored with the page when the client
+            archives responses so `reextract` can restore it, by default None.
 
         Returns
         -------
@@ -44,9 +91,12 @@ class FSC:
             if page:
                 url += f"&page={page}"  # Append page number to the URL
 
-            response = requests.get(url)
+            if category:
+                response = self.client.get(url, archive_meta={"category": category})
+            else:
+                response = self.client.get(url)
             response.raise_for_status()  # Raise exception for bad status
-            return BeautifulSoup(response.text, "html.parser")
+            return soup_from_response(response)
         except requests.RequestException as e:
             print(f"Error fetching data from {url}: {e}")
             return None
@@ -68,11 +118,91 @@ class FSC:
         content_tag = soup.find("div", class_="page-edit")
         return content_tag.get_text(strip=True) if content_tag else "無內文"
 
-    def get_article_details(
+    def get_total_pages(self, soup: BeautifulSoup) -> Optional[int]:
+        """
+        Read the number of listing pages from the pagination widget.
+
+        Parameters
+        ----------
+        soup : BeautifulSoup
+            Parsed first listing page.
+
+        Returns
+        -------
+        Optional[int]
+            The last page number, or None if the page has no pagination.
+        """
+        widget = soup.find(class_=PAGINATION_CLASS) or soup
+        pages = [
+            int(number)
+            for link in widget.find_all("a", href=True)
+            for number in PAGE_PARAM.findall(link["href"])
+        ]
+        match = TOTAL_PAGES.search(widget.get_text())
+        if match:
+            pages.append(int(match.group(1)))
+        return max(pages) if pages else None
+
+    def fetch_content(self, link: str) -> Optional[str]:
+        """
+        Fetch an article page and extract its content.
+
+        Parameters
+        ----------
+        link : str
+            URL of the article.
+
+        Returns
+        -------
+        Optional[str]
+            Main content, or None if the request fails or there is no content.
+        """
+        article_soup = self.fetch_data(link)
+        content = self.extract_content(article_soup) if article_soup else "無內文"
+        return content if content != "無內文" else None
+
+    def parse_row(self, row: Tag, category: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Extract the details of one listing row, without the article content.
+
+        Parameters
+        ----------
+        row : Tag
+            A `<li role="row">` element of the listing page.
+        category : str
+            The category from the URL's dictionary key.
+
+        Returns
+        -------
+        Optional[Dict[str, Optional[str]]]
+            Article details with `content` set to None, or None if the row
+            has no linked title.
+        """
+        title_tag = row.find("a")
+        if not title_tag:
+            return None
+        source_tag = row.find("span", class_="unit")
+        date_tag = row.find("span", class_="date")
+        datetime = date_tag.get_text(strip=True) if date_tag else "未知日期"
+        return {
+            "category": category,
+            "source": source_tag.get_text(strip=True) if source_tag else "未分類",
+            "title": title_tag["title"],
+            "date": datetime if datetime != "未知日期" else None,
+            "month": datetime[:-3],
+            "article_id": self.base_url + title_tag["href"],
+            "content": None,
+        }
+
+    def iter_article_details(
         self, soup: BeautifulSoup, category: str
-    ) -> List[Dict[str, Optional[str]]]:
+    ) -> Iterator[Dict[str, Optional[str]]]:
         """
-        Extract article details from the page.
+        Extract article details from the page, yielding each article in page
+        order as soon as its content has been fetched.
+
+        The rows are parsed first, then the article pages are fetched
+        concurrently by up to `workers` threads.
 
         Parameters
         ----------
@@ -83,86 +213,223 @@ class FSC:
 
         Returns
         -------
-        List[Dict[str, Optional[str]]]
-            List of dictionaries containing article details.
+        Iterator[Dict[str, Optional[str]]]
+            Dictionaries containing article details.
         """
-        articles = []
         rows = soup.find_all("li", role="row")
 
         if not rows:
             print(f"No articles found for {category}.")
-            return articles
+            return
 
         print(f"Found {len(rows)} articles in {category}.")
 
-        for row in rows:
-            source = (
-                row.find("span", class_="unit").get_text(strip=True)
-                if row.find("span", class_="unit")
-                else "未分類"
-            )
-            title_tag = row.find("a")
-            title = title_tag["title"] if title_tag else "無標題"
-            link = self.base_url + title_tag["href"] if title_tag else None
-            datetime = (
-                row.find("span", class_="date").get_text(strip=True)
-                if row.find("span", class_="date")
-                else "未知日期"
-            )
-            month = datetime[:-3]
-
-            # Fetch article content if link is valid
-            content = "無內文"
-            if link:
-                article_soup = self.fetch_data(link)
-                content = (
-                    self.extract_content(article_soup) if article_soup else "無內文"
-                )
+        articles = [self.parse_row(row, category) for row in rows]
+        yield from self.iter_with_content([article for article in articles if article])
 
-            if title != "無標題":
-                article = {
-                    "category": category,
-                    "source": source,
-                    "title": title,
-                    "date": datetime if datetime != "未知日期" else None,
-                    "month": month,
-                    "article_id": link,
-                    "content": content if content != "無內文" else None,
-                }
-                articles.append(article)
+    def iter_with_content(
+        self,
+        articles: List[Dict[str, Optional[str]]],
+        pipeline: Optional["ProcessPipeline"] = None,
+    ) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Fetch the content of parsed listing rows concurrently, yielding them
+        in the given order.
 
-        return articles
+        Parameters
+        ----------
+        articles : List[Dict[str, Optional[str]]]
+            Articles returned by `parse_row`.
+        pipeline : Optional[ProcessPipeline], optional
+            Pipeline fetching and extracting the article pages in worker
+            processes, by default None (threads only).
 
-    def scrape_all(self) -> List[Dict[str, Optional[str]]]:
+        Returns
+        -------
+        Iterator[Dict[str, Optional[str]]]
+            The articles with their content filled in.
         """
-        Scrape all articles from the given URLs.
+        if pipeline is not None:
+            contents = {
+                record["article_id"]: record["content"]
+                for record in pipeline.run(
+                    article["article_id"] for article in articles
+                )
+            }
+            for article in articles:
+                article["content"] = contents.get(article["article_id"])
+                yield article
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            contents = executor.map(
+                self.fetch_content, [article["article_id"] for article in articles]
+            )
+            for article, content in zip(articles, contents):
+                article["content"] = content
+                yield article
+
+    def get_article_details(
+        self, soup: BeautifulSoup, category: str
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Extract article details from the page.
+
+        Parameters
+        ----------
+        soup : BeautifulSoup
+            Parsed HTML page.
+        category : str
+            The category from the URL's dictionary key.
 
         Returns
         -------
         List[Dict[str, Optional[str]]]
-            List of all scraped articles.
+            List of dictionaries containing article details.
+        """
+        return list(self.iter_article_details(soup, category))
+
+    def iter_articles(self) -> Iterator[Dict[str, Optional[str]]]:
         """
-        all_articles = []
-        for category, url in self.urls.items():
-            page = 1
-            total_pages = self.max_pages if self.max_pages else float("inf")
+        Scrape articles from the given URLs, yielding each one as soon as it
+        is extracted.
 
-            while page <= total_pages:
-                soup = self.fetch_data(url, page)
-                if not soup:
-                    print(f"Failed to retrieve page {page} for {category}.")
-                    break
+        The first listing page of every category is fetched in parallel and
+        the page count is read from its pagination widget. Up to `workers`
+        further pages per category are then fetched ahead, while the results
+        are still yielded category by category in page order. With a `store`,
+        paging of a category stops at the first page without new articles.
 
-                articles = self.get_article_details(soup, category)
-                all_articles.extend(articles)
+        Returns
+        -------
+        Iterator[Dict[str, Optional[str]]]
+            Scraped articles.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        pipeline = None
+        if self.processes:
+            from .pipeline import ProcessPipeline
 
-                if len(articles) == 0:
-                    print(f"No more articles found for {category} on page {page}.")
-                    break
+            pipeline = ProcessPipeline(
+                self.client, fetch_workers=self.workers, processes=self.processes
+            )
+        pending: Dict[str, Deque] = {category: deque() for category in self.urls}
+        try:
+            first_pages = {
+                category: executor.submit(self.fetch_data, url, 1, category)
+                for category, url in self.urls.items()
+            }
+            seen = {
+                category: self.store.get(f"fsc-seen/{url}", []) if self.store else []
+                for category, url in self.urls.items()
+            }
+            known = {category: set(links) for category, links in seen.items()}
+            last_pages = {}
+            next_pages = {}
+            for category in self.urls:
+                soup = first_pages[category].result()
+                total_pages = self.get_total_pages(soup) if soup else None
+                if total_pages is None:
+                    # No pagination widget, page until an empty page
+                    total_pages = float("inf")
+                if self.max_pages:
+                    total_pages = min(total_pages, self.max_pages)
+                if soup and all(
+                    self.base_url + link["href"] in known[category]
+                    for link in soup.select('li[role="row"] a[href]')
+                ):
+                    # Nothing new on the first page, do not fetch ahead
+                    total_pages = 1
+                last_pages[category] = total_pages
+                next_pages[category] = 2
+
+            def fill(category: str) -> None:
+                queue = pending[category]
+                while (
+                    len(queue) < self.workers
+                    and next_pages[category] <= last_pages[category]
+                ):
+                    page = next_pages[category]
+                    queue.append(
+                        (
+                            page,
+                            executor.submit(
+                                self.fetch_data, self.urls[category], page, category
+                            ),
+                        )
+                    )
+                    next_pages[category] += 1
+
+            for category in self.urls:
+                fill(category)
+
+            for category, url in self.urls.items():
+                new_links = []
+                page, future = 1, first_pages[category]
+                try:
+                    while True:
+                        soup = future.result()
+                        if not soup:
+                            print(f"Failed to retrieve page {page} for {category}.")
+                            break
+
+                        articles = [
+                            self.parse_row(row, category)
+                            for row in soup.find_all("li", role="row")
+                        ]
+                        articles = [article for article in articles if article]
+                        if not articles:
+                            print(
+                                f"No more articles found for {category} on page {page}."
+                            )
+                            break
+
+                        articles = [
+                            article
+                            for article in articles
+                            if article["article_id"] not in known[category]
+                        ]
+                        if not articles:
+                            print(f"No new articles for {category} on page {page}.")
+                            break
+
+                        print(f"Found {len(articles)} articles in {category}.")
+                        for article in self.iter_with_content(articles, pipeline):
+                            new_links.append(article["article_id"])
+                            yield article
+
+                        fill(category)
+                        if not pending[category]:
+                            break
+                        page, future = pending[category].popleft()
+                finally:
+                    for _, future in pending[category]:
+                        future.cancel()
+                    pending[category].clear()
+                    if self.store:
+                        self.store.set(
+                            f"fsc-seen/{url}",
+                            (new_links + seen[category])[: self.max_seen],
+                        )
+                        self.store.save()
+        finally:
+            for queue in pending.values():
+                for _, future in queue:
+                    future.cancel()
+            executor.shutdown(wait=False)
+            if pipeline is not None:
+                pipeline.close()
 
-                page += 1
+    def scrape_all(self) -> List[Dict[str, Optional[str]]]:
+        """
+        Scrape all articles from the given URLs.
 
-        return all_articles
+        Returns
+        -------
+        List[Dict[str, Optional[str]]]
+            List of all scraped articles.
+        """
+        return list(self.iter_articles())
 
 
 if __name__ == "__main__":
@@ -176,12 +443,9 @@ if __name__ == "__main__":
     max_pages_input = input("請輸入要爬取的最大頁數（或按 Enter 繼續抓取所有頁面）：")
     max_pages = int(max_pages_input) if max_pages_input.isdigit() else None
 
-    # Initialize and run the scraper
+    # Initialize and run the scraper, streaming results to a JSON Lines file
     scraper = FSC(urls, max_pages)
-    all_articles = scraper.scrape_all()
-
-    # Save results to JSON file
-    with open("fsc_articles.json", "w", encoding="utf-8") as f:
-        json.dump(all_articles, f, ensure_ascii=False, indent=4)
+    with open_sink("fsc_articles.jsonl") as sink:
+        sink.write_all(scraper.iter_articles())
 
-    print("爬取完成，結果已保存到 fsc_articles.json")
+    print("爬取完成，結果已保存到 fsc_articles.jsonl")
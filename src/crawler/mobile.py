@@ -1,19 +1,32 @@
+import queue
+import threading
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import json
+from typing import Dict, Iterator, List, Optional
+from .browser import Browser, BrowserPool
+from .sinks import open_sink
 
 
 class Mobile01Crawler:
     """Mobile01 爬蟲"""
 
-    def __init__(self, start_page: int, end_page: int, base_url: str) -> None:
+    def __init__(
+        self,
+        start_page: int,
+        end_page: int,
+        base_url: str,
+        browser: Optional[Browser] = None,
+        wait_timeout: float = 10.0,
+    ) -> None:
         """
         Initializes the Mobile01Crawler class with start and end page numbers and base URL.
 
+        Chrome is not launched here but on the first page request.
+
         Parameters
         ----------
         start_page : int
@@ -21,26 +34,47 @@ class Mobile01Crawler:
         end_page : int
             The last page number to scrape.
         base_url : str
-            The base URL for the topic list.
+            The base URL for the topic list. The page number is appended as
+            `&p=<page>`, or substituted for `{page}` if the URL contains it
+            (e.g. `file:///tmp/mobile01/page{page}.html` for a local copy).
+        browser : Optional[Browser], optional
+            Long-lived browser shared with other crawlers, by default a new
+            `Browser` owned by this crawler and closed by `close`.
+        wait_timeout : float, optional
+            Seconds to wait for the topic list of a page, by default 10.
         """
         self.start_page = start_page  # 爬取的起始页
         self.end_page = end_page  # 爬取的结束页
         self.base_url = base_url  # 基础URL
         self.article_list = []  # 用于存储爬取的信息
+        self.owns_browser = browser is None  # 共享的浏览器由调用方关闭
+        self.browser = browser or Browser()
+        self.wait_timeout = wait_timeout
 
-        # 设置 Chrome 选项
-        chrome_options = Options()
-        chrome_options.add_argument("--disable-gpu")  # 禁用 GPU 加速
-        chrome_options.add_argument("--disable-extensions")  # 禁用扩展
-        chrome_options.add_argument(
-            "--blink-settings=imagesEnabled=false"
-        )  # 不加载图片
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """The Selenium driver, Chrome is launched on first access."""
+        return self.browser.driver
 
-        # 启动 Chrome
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+    def page_url(self, page: int) -> str:
+        """
+        Parameters
+        ----------
+        page : int
+            The page number.
 
-    def fetch_data(self, page: int) -> None:
+        Returns
+        -------
+        str
+            URL of the topic list page.
+        """
+        if "{page}" in self.base_url:
+            return self.base_url.format(page=page)
+        return f"{self.base_url}&p={page}"
+
+    def scrape_page(
+        self, page: int, browser: Optional[Browser] = None
+    ) -> List[Dict[str, str]]:
         """
         Requests the target URL and extracts data from the page.
 
@@ -48,15 +82,31 @@ class Mobile01Crawler:
         ----------
         page : int
             The page number to scrape.
+        browser : Optional[Browser], optional
+            Browser to load the page in, by default `self.browser`.
+
+        Returns
+        -------
+        List[Dict[str, str]]
+            The articles listed on the page.
         """
-        url = f"{self.base_url}&p={page}"
+        url = self.page_url(page)
         print(f"Fetching data from: {url}")
 
-        self.driver.get(url)
-        time.sleep(1)  # 控制加载时间
-
-        titles = self.driver.find_elements(By.CLASS_NAME, "c-listTableTd__title")
+        driver = (browser or self.browser).driver
+        driver.get(url)
+        try:
+            # 列表一出现就开始解析，不再固定等待
+            titles = WebDriverWait(driver, self.wait_timeout).until(
+                EC.presence_of_all_elements_located(
+                    (By.CLASS_NAME, "c-listTableTd__title")
+                )
+            )
+        except TimeoutException:
+            print(f"Timed out waiting for the topic list of {url}")
+            titles = []
 
+        articles = []
         for title in titles:
             try:
                 # 找到 <a> 标签并提取 href 和标题文本
@@ -65,17 +115,184 @@ class Mobile01Crawler:
                 text = link.text
 
                 # 保存文章数据
-                self.article_list.append({"title": text, "link": url})
+                articles.append({"title": text, "link": url})
                 print(f"Scraped: {text}, URL: {url}")
             except Exception as e:
                 print(f"Error fetching data: {e}")
+        return articles
 
-    def get_info(self) -> None:
+    def fetch_data(self, page: int) -> None:
         """
-        Iterates through a range of pages, fetching and extracting data from each page.
+        Scrapes one page and stores its articles in `article_list`.
+
+        Parameters
+        ----------
+        page : int
+            The page number to scrape.
         """
+        self.article_list.extend(self.scrape_page(page))
+
+    def iter_info(
+        self,
+        workers: int = 1,
+        pool: Optional[BrowserPool] = None,
+        max_memory_mb: Optional[float] = None,
+        retries: int = 2,
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Iterates through the page range, yielding each article as soon as its
+        page has been scraped. Nothing is kept in `article_list`.
+
+        With several workers the pages are shared out among a pool of
+        headless browsers and the articles are still yielded in page order.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of browsers scraping pages in parallel, by default 1
+            (`self.browser` only).
+        pool : Optional[BrowserPool], optional
+            Long-lived pool to scrape with instead of a new pool of `workers`
+            headless browsers, by default None.
+        max_memory_mb : Optional[float], optional
+            Restart a pooled browser after a page once it uses more memory
+            than this, see `Browser.memory_usage`, by default None (no limit).
+        retries : int, optional
+            Times a page is retried in a fresh browser after the browser
+            crashed, by default 2.
+
+        Returns
+        -------
+        Iterator[Dict[str, str]]
+            Scraped articles.
+        """
+        if workers == 1 and pool is None:
+            for page in range(self.start_page, self.end_page + 1):
+                yield from self.scrape_page(page)
+            return
+
+        own_pool = pool is None
+        if own_pool:
+            pool = BrowserPool(
+                workers,
+                arguments=self.browser.arguments,
+                driver_path=self.browser.driver_path,
+                page_load_strategy=self.browser.page_load_strategy,
+                blocked_urls=self.browser.blocked_urls,
+            )
+        pages = queue.Queue()
         for page in range(self.start_page, self.end_page + 1):
-            self.fetch_data(page)
+            pages.put(page)
+        results: Dict[int, List[Dict[str, str]]] = {}
+        finished = threading.Condition()
+        stop = threading.Event()
+
+        def work(browser: Browser) -> None:
+            while not stop.is_set():
+                try:
+                    page = pages.get_nowait()
+                except queue.Empty:
+                    return
+                articles = self.scrape_with_retries(page, browser, retries)
+                if max_memory_mb and not stop.is_set():
+                    self.limit_memory(browser, max_memory_mb)
+                with finished:
+                    results[page] = articles
+                    finished.notify_all()
+
+        threads = [
+            threading.Thread(target=work, args=(browser,), daemon=True)
+            for browser in pool
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for page in range(self.start_page, self.end_page + 1):
+                with finished:
+                    finished.wait_for(lambda: page in results)
+                    articles = results.pop(page)
+                yield from articles
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            if own_pool:
+                pool.close()
+
+    def scrape_with_retries(
+        self, page: int, browser: Browser, retries: int
+    ) -> List[Dict[str, str]]:
+        """
+        Scrapes a page, recycling the browser and retrying when it crashed.
+
+        Parameters
+        ----------
+        page : int
+            The page number to scrape.
+        browser : Browser
+            Browser to load the page in.
+        retries : int
+            Times the page is retried in a fresh browser.
+
+        Returns
+        -------
+        List[Dict[str, str]]
+            The articles listed on the page, empty if every attempt failed.
+        """
+        for attempt in range(retries + 1):
+            try:
+                return self.scrape_page(page, browser)
+            except WebDriverException as e:
+                print(f"Browser failed on page {page} (attempt {attempt + 1}): {e}")
+                browser.recycle()
+            except Exception as e:
+                print(f"Error scraping page {page}: {e}")
+                return []
+        return []
+
+    def limit_memory(self, browser: Browser, max_memory_mb: float) -> None:
+        """
+        Restarts a browser that uses more memory than allowed.
+
+        Parameters
+        ----------
+        browser : Browser
+            Browser to check.
+        max_memory_mb : float
+            Memory ceiling in MB.
+        """
+        try:
+            usage = browser.memory_usage()
+        except WebDriverException:
+            usage = None
+        if usage and usage > max_memory_mb * 1024 * 1024:
+            print(f"Browser uses {usage / 1024 / 1024:.0f} MB, restarting")
+            browser.recycle()
+
+    def get_info(
+        self,
+        workers: int = 1,
+        pool: Optional[BrowserPool] = None,
+        max_memory_mb: Optional[float] = None,
+    ) -> None:
+        """
+        Iterates through a range of pages, fetching and extracting data from each page.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of headless browsers scraping in parallel, by default 1.
+            The articles are stored in page order either way.
+        pool : Optional[BrowserPool], optional
+            Long-lived pool to scrape with, by default None.
+        max_memory_mb : Optional[float], optional
+            Memory ceiling per pooled browser in MB, by default None.
+        """
+        if workers == 1 and pool is None:
+            for page in range(self.start_page, self.end_page + 1):
+                self.fetch_data(page)
+            return
+        self.article_list.extend(self.iter_info(workers, pool, max_memory_mb))
 
     def save_to_json(self, filename: str) -> None:
         """
@@ -91,8 +308,9 @@ class Mobile01Crawler:
         print(f"Data saved to {filename}")
 
     def close(self) -> None:
-        """关闭 Selenium 浏览器"""
-        self.driver.quit()
+        """关闭 Selenium 浏览器（共享的浏览器不会关闭）"""
+        if self.owns_browser:
+            self.browser.quit()
 
 
 # 测试代码
@@ -101,5 +319,6 @@ if __name__ == "__main__":
     crawler = Mobile01Crawler(
         start_page=1, end_page=2, base_url=base_url
     )  # 爬取第1到2页
-    crawler.get_info()  # 开始爬取
+    with open_sink("mobile01.jsonl") as sink:
+        sink.write_all(crawler.iter_info())  # 开始爬取，边爬边写入
     crawler.close()  # 关闭浏览器
@@ -0,0 +1,192 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Any, Callable, Optional, Union
+
+# lxml and html.parser repair malformed markup differently (e.g. a <div>
+# inside a <p>), so lxml is opt-in, only for extractors checked against it
+DEFAULT_PARSER = "html.parser"
+try:
+    import lxml  # noqa: F401
+
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = "html.parser"
+
+HEADER_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+class AnyOf(SoupStrainer):
+    """
+    SoupStrainer that keeps a top-level tag if any of the given strainers would.
+
+    A plain SoupStrainer can only AND its rules together, while an extractor
+    usually needs a few unrelated subtrees (e.g. one `<meta>` plus the article
+    body). Only the matching subtrees are built, everything else is skipped
+    while parsing.
+    """
+
+    def __init__(self, *strainers: SoupStrainer) -> None:
+        """
+        Parameters
+        ----------
+        *strainers : SoupStrainer
+            Strainers describing the subtrees to keep.
+        """
+        super().__init__()
+        self.strainers = strainers
+
+    # beautifulsoup4 >= 4.13
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    @property
+    def excludes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        for strainer in self.strainers:
+            found = strainer.search_tag(markup_name, markup_attrs)
+            if found:
+                return found
+        return None
+
+
+def has_class(css_class: str) -> Callable[[Any], bool]:
+    """
+    Build a SoupStrainer attribute rule matching one CSS class.
+
+    Strainers see the raw `class` attribute before it is split into a list,
+    so `class_="b"` would miss `class="a b"`.
+
+    Parameters
+    ----------
+    css_class : str
+        CSS class name.
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        Rule usable as `SoupStrainer(attrs={"class": has_class(...)})`.
+    """
+
+    def match(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return css_class in classes
+
+    return match
+
+
+def make_soup(
+    markup: Union[str, bytes],
+    parse_only: Optional[SoupStrainer] = None,
+    parser: Optional[str] = None,
+    from_encoding: Optional[str] = None,
+) -> BeautifulSoup:
+    """
+    Parse HTML, with html.parser unless another backend is requested.
+
+    Parameters
+    ----------
+    markup : Union[str, bytes]
+        HTML document.
+    parse_only : Optional[SoupStrainer], optional
+        Only build the subtrees matched by this strainer, by default the whole
+        document.
+    parser : Optional[str], optional
+        BeautifulSoup tree builder, by default `DEFAULT_PARSER`. Pass
+        `FAST_PARSER` (lxml when it is installed) where the extractor has been
+        checked to give the same output with it.
+    from_encoding : Optional[str], optional
+        Encoding of `markup` when it is bytes, by default detected by
+        BeautifulSoup.
+
+    Returns
+    -------
+    BeautifulSoup
+        Parsed document.
+    """
+    return BeautifulSoup(
+        markup,
+        parser or DEFAULT_PARSER,
+        parse_only=parse_only,
+        from_encoding=from_encoding if isinstance(markup, bytes) else None,
+    )
+
+
+def declared_encoding(response, default: Optional[str] = "utf-8") -> Optional[str]:
+    """
+    Find the encoding of a response without decoding its body.
+
+    The charset of the Content-Type header wins, then a `<meta charset>`
+    declaration in the first 2 KB, then `default`. Unlike `response.text`,
+    nothing is detected by scanning the whole body.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The fetched page.
+    default : Optional[str], optional
+        Encoding the site is known to use, by default "utf-8".
+
+    Returns
+    -------
+    Optional[str]
+        The encoding to decode the body with.
+    """
+    match = HEADER_CHARSET.search(response.headers.get("Content-Type", ""))
+    if match:
+        return match.group(1)
+    match = META_CHARSET.search(response.content[:2048])
+    if match:
+        return match.group(1).decode("ascii")
+    return default
+
+
+def soup_from_response(
+    response,
+    parse_only: Optional[SoupStrainer] = None,
+    default_encoding: Optional[str] = "utf-8",
+    parser: Optional[str] = None,
+) -> BeautifulSoup:
+    """
+    Parse a response from its raw bytes with a declared or known encoding.
+
+    `response.text` falls back to charset detection over the whole body when
+    the server sends no charset, and the parser then decodes the text once
+    more. Handing `response.content` to the parser decodes it exactly once.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The fetched page.
+    parse_only : Optional[SoupStrainer], optional
+        Only build the subtrees matched by this strainer, by default the whole
+        document.
+    default_encoding : Optional[str], optional
+        Encoding used when neither the headers nor the page declare one,
+        by default "utf-8".
+    parser : Optional[str], optional
+        BeautifulSoup tree builder, see `make_soup`.
+
+    Returns
+    -------
+    BeautifulSoup
+        Parsed document.
+    """
+    return make_soup(
+        response.content,
+        parse_only=parse_only,
+        parser=parser,
+        from_encoding=declared_encoding(response, default_encoding),
+    )
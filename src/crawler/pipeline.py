@@ -0,0 +1,168 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
+import requests
+from .reextract import extract_record
+from .transport import HttpClient, get_default_client
+
+
+def extract_batch(
+    records: List[Dict], structured_comments: bool = False
+) -> List[List[Dict]]:
+    """
+    Extract a chunk of fetched pages in a worker process.
+
+    Parameters
+    ----------
+    records : List[Dict]
+        Fetched pages in the `iter_archive` record format.
+    structured_comments : bool, optional
+        Passed to `PTT`, by default False.
+
+    Returns
+    -------
+    List[List[Dict]]
+        The records extracted from each page, see `extract_record`.
+    """
+    return [extract_record(record, structured_comments)[1] for record in records]
+
+
+class ProcessPipeline:
+    """
+    Fetch pages with threads and extract them in a process pool.
+
+    Parsing and extraction run under the GIL, so with threads alone a crawl
+    uses one core however many pages are fetched at once. Here the fetch
+    threads only download raw bytes, which are sent in chunks of
+    `chunk_size` pages to a `ProcessPoolExecutor` running `extract_record`.
+    Chunking keeps the pickling and IPC cost per page low, so extraction
+    scales with the number of cores.
+    """
+
+    def __init__(
+        self,
+        client: Optional[HttpClient] = None,
+        fetch_workers: int = 8,
+        processes: Optional[int] = None,
+        chunk_size: int = 16,
+        structured_comments: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        client : Optional[HttpClient], optional
+            Shared HTTP client, by default `get_default_client()`.
+        fetch_workers : int, optional
+            Number of fetch threads, by default 8. The per-host rate limit of
+            the client still applies.
+        processes : Optional[int], optional
+            Number of extraction processes, by default the number of CPUs.
+        chunk_size : int, optional
+            Pages sent to an extraction process at once, by default 16.
+        structured_comments : bool, optional
+            Passed to `PTT`, by default False.
+        """
+        self.client = client or get_default_client()
+        self.fetch_workers = fetch_workers
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.structured_comments = structured_comments
+        self.fetcher = ThreadPoolExecutor(max_workers=fetch_workers)
+        self.extractor = ProcessPoolExecutor(max_workers=processes)
+        # Chunks waiting for or running in the pool, bounds the memory used
+        self.max_batches = 2 * (processes or os.cpu_count() or 1)
+
+    def fetch(self, url: str) -> Optional[Dict]:
+        """
+        Parameters
+        ----------
+        url : str
+            URL of the page.
+
+        Returns
+        -------
+        Optional[Dict]
+            The raw page in the `iter_archive` record format, or None if the
+            request fails.
+        """
+        try:
+            response = self.client.get(url)
+        except requests.RequestException as e:
+            print(f"Error fetching data from {url}: {e}")
+            return None
+        if response.status_code != 200:
+            print(f"Error fetching data from {url}: HTTP {response.status_code}")
+            return None
+        return {
+            "url": url,
+            "final_url": response.url,
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": response.content,
+        }
+
+    def run(self, urls: Iterable[str]) -> Iterator[Dict]:
+        """
+        Fetch and extract pages, yielding the records in the order of `urls`.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            Pages to crawl, consumed lazily.
+
+        Returns
+        -------
+        Iterator[Dict]
+            Records extracted by `extract_record`.
+        """
+        urls = iter(urls)
+        fetches: Deque = deque()
+        batches: Deque = deque()
+        batch: List[Dict] = []
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(fetches) < 2 * self.fetch_workers:
+                    url = next(urls, None)
+                    if url is None:
+                        exhausted = True
+                    else:
+                        fetches.append(self.fetcher.submit(self.fetch, url))
+
+                if fetches:
+                    record = fetches.popleft().result()
+                    if record:
+                        batch.append(record)
+
+                finished = exhausted and not fetches
+                if batch and (len(batch) >= self.chunk_size or finished):
+                    batches.append(
+                        self.extractor.submit(
+                            extract_batch, batch, self.structured_comments
+                        )
+                    )
+                    batch = []
+
+                while batches and (
+                    finished or batches[0].done() or len(batches) >= self.max_batches
+                ):
+                    for results in batches.popleft().result():
+                        yield from results
+
+                if finished and not batches:
+                    return
+        finally:
+            for future in list(fetches) + list(batches):
+                future.cancel()
+
+    def close(self) -> None:
+        """Stop the fetch threads and the extraction processes."""
+        self.fetcher.shutdown(wait=False)
+        self.extractor.shutdown()
+
+    def __enter__(self) -> "ProcessPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,9 +1,16 @@
-import requests
+import asyncio
+import functools
+import queue
 import re
-import time
-from bs4 import BeautifulSoup
+import threading
+import types
+from bs4 import BeautifulSoup, Comment, SoupStrainer, Tag
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from .parsing import FAST_PARSER, AnyOf, has_class, soup_from_response
+from .store import JsonStore
+from .transport import HttpClient, get_default_client
 
 
 def EmptyConentHandler(func):
@@ -16,13 +23,53 @@ def EmptyConentHandler(func):
     return wrapper
 
 
+class StaticCompatible:
+    """
+    讓原本的 staticmethod 改為 instance method 後仍可從類別呼叫：
+    `PTT.get_raw_page(url)` 時 `self` 為 None
+    """
+
+    def __init__(self, func):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance, owner=None):
+        if instance is not None:
+            return types.MethodType(self.func, instance)
+
+        @functools.wraps(self.func)
+        def static(*args, **kwargs):
+            return self.func(None, *args, **kwargs)
+
+        return static
+
+
 class PTT_BASE:
     home = "https://www.ptt.cc"
+    # client 尚未設定 www.ptt.cc 的 rate limit 時，兩次請求之間的平均間隔（秒）
+    default_sleep = 5
     board_and_page_url = "/bbs/{board}/index{page}.html"
+    # 只建立解析時需要的子樹
+    index_strainer = AnyOf(
+        SoupStrainer("div", attrs={"class": has_class("btn-group-paging")}),
+        SoupStrainer("div", attrs={"class": has_class("r-ent")}),
+        SoupStrainer("div", attrs={"class": has_class("r-list-sep")}),
+    )
+    article_strainer = AnyOf(
+        SoupStrainer("meta", attrs={"property": "og:title"}),
+        SoupStrainer("div", attrs={"id": "main-content"}),
+    )
 
 
 class PTT:
-    def __init__(self, board: str, crawler_pages: int = 5, sleep: int = 5) -> None:
+    def __init__(
+        self,
+        board: str,
+        crawler_pages: int = 5,
+        sleep: Optional[float] = None,
+        client: Optional[HttpClient] = None,
+        structured_comments: bool = False,
+    ) -> None:
         """
         Parameters
         ----------
@@ -34,12 +81,30 @@ class PTT:
             ```
         crawler_pages : int, optional
             總共要爬幾頁，由最後一頁往前算, by default 5
-        sleep : int, optional
-            避免太過快速的對對方的網站請求，在每次爬完文章後的休息時間, by default 5
+        sleep : Optional[float], optional
+            避免太過快速的對對方的網站請求，同一主機兩次請求之間的平均間隔（秒）
+            由 client 的 rate limiter 控制，並行下載時仍然有效；指定時會覆蓋 client
+            對 www.ptt.cc 的設定。None 則沿用 client 既有設定，尚未設定時為
+            `PTT_BASE.default_sleep` 秒, by default None
+        client : Optional[HttpClient], optional
+            共用連線池的 HTTP client，預設使用 `get_default_client()`
+        structured_comments : bool, optional
+            True 時 `comments` 改為 `parse_comments` 的結構化推文，且不再回傳 `comments_1`,
+            by default False
         """
         self.board = board
         self.crawler_pages = crawler_pages
         self.sleep = sleep
+        self.structured_comments = structured_comments
+        self.client = client or get_default_client()
+        if sleep is not None:
+            self.client.rate_limiter.configure(
+                PTT_BASE.home, 1 / sleep if sleep else None
+            )
+        else:
+            self.client.rate_limiter.setdefault(
+                PTT_BASE.home, 1 / PTT_BASE.default_sleep
+            )
 
     @staticmethod
     def full_url(board: str, page: int) -> str:
@@ -47,9 +112,33 @@ class PTT:
             board=board, page=page
         )
 
-    @staticmethod
-    def get_raw_page(url: str) -> BeautifulSoup:
-        return BeautifulSoup(requests.get(url, allow_redirects=False).text, "html.parser")
+    @StaticCompatible
+    def get_raw_page(
+        self, url: str, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """
+        從類別呼叫（`PTT.get_raw_page(url)`，舊版的 staticmethod 用法）時使用
+        `get_default_client()`
+
+        Parameters
+        ----------
+        url : str
+            頁面的 URL
+        parse_only : Optional[SoupStrainer], optional
+            只解析符合的子樹，例如 `PTT_BASE.article_strainer`, by default 全部解析
+
+        Returns
+        -------
+        BeautifulSoup
+            解析後的頁面
+        """
+        # 只解析 strainer 選出的子樹時，lxml 與 html.parser 的結果相同
+        client = self.client if self is not None else get_default_client()
+        return soup_from_response(
+            client.get(url, allow_redirects=False),
+            parse_only=parse_only,
+            parser=FAST_PARSER if parse_only is not None else None,
+        )
 
     def get_last_page_number(self, soup: str) -> int:
         """
@@ -90,6 +179,88 @@ class PTT:
 
         return article_urls
 
+    def get_article_entries(self, soup: str) -> List[Tuple[str, str]]:
+        """
+        Parameters
+        ----------
+        css_name : str
+            文章列的 css 名稱，用於定位；`nrec` 為推文數
+
+        Returns
+        -------
+        list
+            所有文章的 URL 與索引頁上顯示的推文數（例如 `"12"`、`"爆"`、`"X1"`、`""`）
+        """
+        css_name = "r-ent"
+        entries = []
+        for l in soup.find_all("div", attrs={"class": css_name}):
+            title = l.find("div", attrs={"class": "title"})
+            if title and title.a:
+                nrec = l.find("div", attrs={"class": "nrec"})
+                entries.append(
+                    (
+                        PTT_BASE.home + title.a["href"],
+                        nrec.get_text(strip=True) if nrec else "",
+                    )
+                )
+
+        return entries
+
+    def get_page_timestamps(self, soup: str) -> List[int]:
+        """
+        Parameters
+        ----------
+        css_name : str
+            `r-list-sep` 之後為置底文章，不計入
+
+        Returns
+        -------
+        list
+            索引頁上每篇文章的發文時間（Unix timestamp，取自文章 ID）
+        """
+        css_name = "r-list-sep"
+        timestamps = []
+        for l in soup.find_all("div", attrs={"class": ["r-ent", css_name]}):
+            if css_name in l["class"]:
+                break
+            if l.a:
+                timestamps.append(
+                    PTT.get_article_timestamp(PTT.get_article_id(l.a["href"]))
+                )
+
+        return [ts for ts in timestamps if ts]
+
+    @staticmethod
+    def get_article_id(url: str) -> str:
+        """
+        Parameters
+        ----------
+        url : str
+            文章的 URL，例如 `https://www.ptt.cc/bbs/Finance/M.1728612345.A.1B2.html`
+
+        Returns
+        -------
+        str
+            文章 ID，例如 `M.1728612345.A.1B2`
+        """
+        return url.rsplit("/", 1)[-1].replace(".html", "")
+
+    @staticmethod
+    def get_article_timestamp(article_id: str) -> int:
+        """
+        Parameters
+        ----------
+        article_id : str
+            文章 ID，第二段為發文的 Unix timestamp，例如 `M.1728612345.A.1B2`
+
+        Returns
+        -------
+        int
+            發文的 Unix timestamp，無法解析時為 0
+        """
+        parts = article_id.split(".")
+        return int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+
     # Following methods are for getting the content of the article ------------------------------
     @staticmethod
     def get_article_category(string) -> str:
@@ -117,31 +288,47 @@ class PTT:
     @EmptyConentHandler
     def get_article_content(soup: str) -> str:
         """
+        單次走訪 `bbs-screen bbs-content` 的子節點取出內文，時間與文章長度成線性
+
         Parameters
         ----------
-        re_content : regex
-            `r"(作者.{1,30}看板.{1,30}標題.{1,30}時間.{1,30}=?)[\s\S]+(?=※ 發信站:)"` 尋找符合該規則的內文
-            開頭：`作者` `看板` `標題` `時間`
-            結尾：`※ 發信站:`
+        meta_css_names : tuple
+            開頭：最後一個 `article-metaline` / `article-metaline-right` 節點之後
+        signature : str
+            結尾：最後一個以 `※ 發信站:` 開頭的節點之前，找不到時取到推文之前
 
         Returns
         -------
         str
             內文
         """
-        re_content = (
-            r"(作者.{1,30}看板.{1,30}標題.{1,30}時間.{1,30}=?)[\s\S]+(?=※ 發信站:)"
-        )
-        raw_content = soup.find_all("div", attrs={"class": "bbs-screen bbs-content"})[
-            0
-        ].text
-        matches = re.finditer(re_content, raw_content)
+        meta_css_names = ("article-metaline", "article-metaline-right")
+        signature = "※ 發信站:"
+        main_content = soup.find("div", attrs={"class": "bbs-screen bbs-content"})
 
-        for match in matches:
-            full_content = match.group(0)
-            meta_info = match.group(1)
+        pieces = []
+        length = 0
+        end = None
+        for node in main_content.children:
+            if isinstance(node, Comment):
+                continue
+            if isinstance(node, Tag):
+                css = node.get("class") or []
+                if any(name in css for name in meta_css_names):
+                    # 作者、看板、標題、時間之前的內容都不算內文
+                    pieces, length, end = [], 0, None
+                    continue
+                if "push" in css:
+                    continue
+                text = node.get_text()
+                if text.startswith(signature):
+                    end = length
+            else:
+                text = str(node)
+            pieces.append(text)
+            length += len(text)
 
-        return full_content.replace(meta_info, "")
+        return "".join(pieces)[:end]
 
     @staticmethod
     def get_article_comments(soup: str) -> list:
@@ -162,6 +349,39 @@ class PTT:
             comments.append(comment.text.replace("\n", ""))
         return comments
 
+    @staticmethod
+    def parse_comments(soup: str) -> List[dict]:
+        """
+        單次走訪推文，直接拆成結構化欄位
+
+        Parameters
+        ----------
+        css_name : str
+            推文的 css 名稱，每則推文依序為 `push-tag` `push-userid` `push-content` `push-ipdatetime`
+
+        Returns
+        -------
+        list
+            每則推文為 `{"tag": "推", "user": ..., "text": ..., "ip_datetime": ...}`
+        """
+        css_name = "push"
+        comments = []
+        for comment in soup.find_all("div", attrs={"class": css_name}):
+            spans = comment.find_all("span", recursive=False)
+            # 例如「檔案過大！部分文章無法顯示」這類提示沒有完整的四個欄位
+            if len(spans) < 4:
+                continue
+            tag, user, text, ip_datetime = (span.get_text() for span in spans[:4])
+            comments.append(
+                {
+                    "tag": tag.strip(),
+                    "user": user.strip(),
+                    "text": text[1:].strip() if text.startswith(":") else text.strip(),
+                    "ip_datetime": ip_datetime.strip(),
+                }
+            )
+        return comments
+
     @staticmethod
     def get_article_datetime(soup: str) -> str:
         """
@@ -215,14 +435,7 @@ class PTT:
         title = PTT.get_article_title(soup)
         category = PTT.get_article_category(title)
         content = PTT.get_article_content(soup)
-        comments = PTT.get_article_comments(soup)
         datetime = PTT.get_article_datetime(soup)
-        # 取冒號之後
-        comments_1 = [
-            text.split(":", 1)[1] if ":" in text else text for text in comments
-        ]
-        # print("comments:", comments)
-        # print("comments_1:", comments_1)
         article_content = {
             "category": category,
             "title": title.replace(f"[{category}]", "").lstrip(),
@@ -230,28 +443,640 @@ class PTT:
             "link": link,
             "article_id": link,
             "content": content,
-            "comments": comments,
-            "comments_1": comments_1,
         }
 
+        if self.structured_comments:
+            article_content["comments"] = PTT.parse_comments(soup)
+            return article_content
+
+        comments = PTT.get_article_comments(soup)
+        # 取冒號之後
+        comments_1 = [
+            text.split(":", 1)[1] if ":" in text else text for text in comments
+        ]
+        # print("comments:", comments)
+        # print("comments_1:", comments_1)
+        article_content["comments"] = comments
+        article_content["comments_1"] = comments_1
+
         return article_content
 
+    def iter_index_pages(
+        self, first_page: Optional[int] = None
+    ) -> Iterator[Tuple[int, BeautifulSoup]]:
+        """
+        由最後一頁往前逐頁下載 `crawler_pages` 頁索引頁
+
+        Parameters
+        ----------
+        first_page : Optional[int], optional
+            改為一路往前翻到這一頁（含）為止，不受 `crawler_pages` 限制,
+            by default None
+
+        Returns
+        -------
+        Iterator[Tuple[int, BeautifulSoup]]
+            頁碼與解析後的索引頁
+        """
+        raw_index_page = self.get_raw_page(
+            PTT.full_url(self.board, ""), parse_only=PTT_BASE.index_strainer
+        )
+        last_page_number = self.get_last_page_number(raw_index_page)
+        if first_page is None:
+            first_page = last_page_number - self.crawler_pages + 1
+
+        for page in range(last_page_number, max(first_page, 1) - 1, -1):
+            raw_article_page = self.get_raw_page(
+                PTT.full_url(self.board, page), parse_only=PTT_BASE.index_strainer
+            )
+            yield page, raw_article_page
+
+    def iter_article_urls(self) -> Iterator[str]:
+        """
+        逐頁下載索引頁，每解析完一頁就立即回傳該頁的文章 URL
+
+        Returns
+        -------
+        Iterator[str]
+            由最後一頁往前 `crawler_pages` 頁的所有文章 URL
+        """
+        for _, raw_article_page in self.iter_index_pages():
+            yield from self.get_article_urls(raw_article_page)
+
+    def get_all_article_urls(self) -> List[str]:
+        """
+        Returns
+        -------
+        list
+            由最後一頁往前 `crawler_pages` 頁的所有文章 URL
+        """
+        return list(self.iter_article_urls())
+
+    def fetch_article(self, article_url: str) -> dict:
+        """
+        Parameters
+        ----------
+        article_url : str
+            文章的 URL
+
+        Returns
+        -------
+        dict
+            下載並解析後的文章資訊，格式同 `get_article_info`
+        """
+        raw_content_page = self.get_raw_page(
+            article_url, parse_only=PTT_BASE.article_strainer
+        )
+        return self.get_article_info(link=article_url, soup=raw_content_page)
+
     def get(self):
-        raw_index_page = self.get_raw_page(PTT.full_url(self.board, ""))
+        for article_url in self.iter_article_urls():
+            yield self.fetch_article(article_url)
+
+    def find_page_range(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """
+        以二分搜尋找出發文時間落在 `since` ~ `until` 的索引頁範圍，
+        只需下載 O(log N) 頁索引頁
+
+        Parameters
+        ----------
+        since : Optional[datetime], optional
+            起始時間（含），None 表示從第一頁開始
+        until : Optional[datetime], optional
+            結束時間（不含），None 表示到最後一頁
+
+        Returns
+        -------
+        Tuple[int, int]
+            涵蓋該時間區間的第一頁與最後一頁頁碼
+        """
+        raw_index_page = self.get_raw_page(
+            PTT.full_url(self.board, ""), parse_only=PTT_BASE.index_strainer
+        )
         last_page_number = self.get_last_page_number(raw_index_page)
-        article_urls = []
+        bounds = {}
+
+        def page_bounds(page: int) -> Optional[Tuple[int, int]]:
+            # 整頁文章都被刪除時，往前找最近一頁有文章的索引頁
+            for candidate in range(page, 0, -1):
+                if candidate not in bounds:
+                    raw_article_page = self.get_raw_page(
+                        PTT.full_url(self.board, candidate),
+                        parse_only=PTT_BASE.index_strainer,
+                    )
+                    timestamps = self.get_page_timestamps(raw_article_page)
+                    bounds[candidate] = (
+                        (min(timestamps), max(timestamps)) if timestamps else None
+                    )
+                if bounds[candidate]:
+                    return bounds[candidate]
+            return None
+
+        first_page, last_page = 1, last_page_number
+        if since:
+            # 第一個「最晚發文時間 >= since」的頁面
+            lo, hi = 1, last_page_number
+            while lo < hi:
+                mid = (lo + hi) // 2
+                page_range = page_bounds(mid)
+                if page_range and page_range[1] >= since.timestamp():
+                    hi = mid
+                else:
+                    lo = mid + 1
+            first_page = lo
+        if until:
+            # 最後一個「最早發文時間 < until」的頁面
+            lo, hi = first_page, last_page_number
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                page_range = page_bounds(mid)
+                if not page_range or page_range[0] < until.timestamp():
+                    lo = mid
+                else:
+                    hi = mid - 1
+            last_page = lo
+
+        return first_page, last_page
+
+    def get_between(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> Iterator[dict]:
+        """
+        爬取發文時間落在 `since` ~ `until` 的文章，不受 `crawler_pages` 限制，
+        由新到舊回傳
+
+        Parameters
+        ----------
+        since : Optional[datetime], optional
+            起始時間（含），None 表示從第一頁開始
+        until : Optional[datetime], optional
+            結束時間（不含），None 表示到最後一頁
+
+        Returns
+        -------
+        Iterator[dict]
+            文章資訊，格式同 `get_article_info`
+        """
+        first_page, last_page = self.find_page_range(since, until)
+        start = since.timestamp() if since else float("-inf")
+        end = until.timestamp() if until else float("inf")
+
+        for page in range(last_page, first_page - 1, -1):
+            raw_article_page = self.get_raw_page(
+                PTT.full_url(self.board, page), parse_only=PTT_BASE.index_strainer
+            )
+            for article_url in self.get_article_urls(raw_article_page):
+                timestamp = PTT.get_article_timestamp(PTT.get_article_id(article_url))
+                if start <= timestamp < end:
+                    yield self.fetch_article(article_url)
+
+    def get_incremental(self, store: JsonStore, max_seen: int = 5000) -> Iterator[dict]:
+        """
+        只爬上次執行後的新文章。每個看板在 store 中記錄上次的最後一頁頁碼
+        （high-water mark）與已爬過的文章 ID，往前翻頁到達已知內容即停止。
+        已有 watermark 時一路翻回 watermark 那一頁，不受 `crawler_pages`
+        限制，避免漏爬；第一次執行只翻 `crawler_pages` 頁
+
+        Parameters
+        ----------
+        store : JsonStore
+            保存 watermark 的本地 store，key 為 `ptt/{board}`
+        max_seen : int, optional
+            每個看板保留的已爬文章 ID 數量上限（保留最新的）, by default 5000
+
+        Returns
+        -------
+        Iterator[dict]
+            新文章的資訊，格式同 `get_article_info`
+        """
+        key = f"ptt/{self.board}"
+        state = store.get(key) or {"last_page": None, "seen": []}
+        seen = set(state["seen"])
+        known_page = state["last_page"]
+        newest_page = None
+
+        def save(last_page: Optional[int]) -> None:
+            latest = sorted(seen, key=PTT.get_article_timestamp)[-max_seen:]
+            store.set(key, {"last_page": last_page, "seen": latest})
+            store.save()
+
+        completed = False
+        try:
+            for page, raw_article_page in self.iter_index_pages(known_page):
+                newest_page = newest_page or page
+                article_urls = self.get_article_urls(raw_article_page)
+                new_urls = [
+                    url for url in article_urls if PTT.get_article_id(url) not in seen
+                ]
+                for article_url in new_urls:
+                    yield self.fetch_article(article_url)
+                    seen.add(PTT.get_article_id(article_url))
+                save(known_page)
+
+                # 這一頁已包含看過的文章，更早的頁面都已爬過
+                if (
+                    known_page
+                    and page <= known_page
+                    and len(new_urls) < len(article_urls)
+                ):
+                    break
+            completed = True
+        finally:
+            # 沒走完（中途停止或出錯）時 watermark 不前進，下次從原位置補爬
+            save((newest_page or known_page) if completed else known_page)
+
+    def pipeline(
+        self, workers: int = 4, queue_size: int = 32, ordered: bool = True
+    ) -> Iterator[dict]:
+        """
+        以 producer/consumer 方式爬取：索引頁解析結果放入有上限的 queue，
+        文章下載的 worker 立即取用，第一篇文章不必等所有索引頁下載完，
+        記憶體用量也不隨 `crawler_pages` 增加
+
+        Parameters
+        ----------
+        workers : int, optional
+            同時下載文章的執行緒數, by default 4
+        queue_size : int, optional
+            待下載 URL queue 的上限；依序回傳時也是已下載但尚未回傳的文章數上限,
+            by default 32
+        ordered : bool, optional
+            True 時依索引頁順序回傳（同 `get`），False 時依完成順序回傳, by default True
+
+        Returns
+        -------
+        Iterator[dict]
+            文章資訊，格式同 `get_article_info`
+        """
+        url_queue = queue.Queue(maxsize=queue_size)
+        result_queue = queue.Queue(maxsize=queue_size)
+        # 依序回傳時，最多只能領先尚未回傳的第一篇 `queue_size` 篇，
+        # 該篇下載較慢時其他 worker 會暫停，`pending` 不會無限增長
+        window = threading.Semaphore(queue_size)
+        stop = threading.Event()
+        done = object()
+
+        def put(q: queue.Queue, item) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for item in enumerate(self.iter_article_urls()):
+                    # 依文章順序取得名額，下一篇要回傳的文章一定已經有名額
+                    while ordered and not window.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if not put(url_queue, item):
+                        return
+            except Exception as e:
+                put(result_queue, (None, e))
+            finally:
+                for _ in range(workers):
+                    put(url_queue, done)
+
+        def consume() -> None:
+            while not stop.is_set():
+                try:
+                    item = url_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is done:
+                    break
+                index, article_url = item
+                try:
+                    put(result_queue, (index, self.fetch_article(article_url)))
+                except Exception as e:
+                    put(result_queue, (None, e))
+            put(result_queue, done)
+
+        threads = [threading.Thread(target=produce, daemon=True)]
+        threads += [
+            threading.Thread(target=consume, daemon=True) for _ in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        pending = {}
+        next_index = 0
+        running = workers
+        try:
+            while running:
+                item = result_queue.get()
+                if item is done:
+                    running -= 1
+                    continue
+                index, article_info = item
+                if index is None:
+                    raise article_info
+                if not ordered:
+                    yield article_info
+                    continue
+                pending[index] = article_info
+                while next_index in pending:
+                    window.release()
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            stop.set()
+
+    def process_pipeline(
+        self,
+        fetch_workers: int = 8,
+        processes: Optional[int] = None,
+        chunk_size: int = 16,
+    ) -> Iterator[dict]:
+        """
+        執行緒只負責下載文章的原始 bytes，解析與擷取交給 `ProcessPipeline`
+        的 process pool，以 `chunk_size` 篇為一批傳送，可同時使用多個 CPU 核心
+
+        Parameters
+        ----------
+        fetch_workers : int, optional
+            同時下載文章的執行緒數, by default 8
+        processes : Optional[int], optional
+            解析文章的 process 數, by default CPU 核心數
+        chunk_size : int, optional
+            每次送給 process 的文章數, by default 16
+
+        Returns
+        -------
+        Iterator[dict]
+            依索引頁順序回傳文章資訊，格式同 `get_article_info`
+        """
+        from .pipeline import ProcessPipeline
+
+        with ProcessPipeline(
+            self.client,
+            fetch_workers=fetch_workers,
+            processes=processes,
+            chunk_size=chunk_size,
+            structured_comments=self.structured_comments,
+        ) as pipeline:
+            yield from pipeline.run(self.iter_article_urls())
+
+    def refresh(self, store: JsonStore) -> Iterator[dict]:
+        """
+        依索引頁上的推文數（`nrec`）只重新下載推文數有變化的文章，
+        回傳上次之後新增的推文。store 中以 `ptt-pushes/{board}` 記錄每篇文章
+        上次的推文數與推文則數，只保留這次 `crawler_pages` 頁內看到的文章；
+        第一次看到的文章也會下載，所有推文都視為新推文。
+
+        `nrec` 是推減噓的淨值，且不計「→」，因此一推加一噓或只有新的「→」時
+        數字不變，這些新推文要等 `nrec` 下次變化才會回傳；「爆」（100 以上）
+        與「X…」（-10 以下）的文章則每次都重新下載
+
+        Parameters
+        ----------
+        store : JsonStore
+            保存推文數的本地 store
+
+        Returns
+        -------
+        Iterator[dict]
+            `{"link", "article_id", "nrec", "new_comments"}`，`new_comments`
+            的格式依 `structured_comments` 同 `parse_comments` 或 `get_article_comments`
+        """
+        key = f"ptt-pushes/{self.board}"
+        known = store.get(key) or {}
+        current = {}
+
+        completed = False
+        try:
+            for _, raw_article_page in self.iter_index_pages():
+                for article_url, nrec in self.get_article_entries(raw_article_page):
+                    article_id = PTT.get_article_id(article_url)
+                    record = known.get(article_id)
+                    # 「爆」與「X…」是區間，推文數變化時標示可能不變，一律重新下載
+                    saturated = nrec == "爆" or nrec.startswith("X")
+                    if record and record["nrec"] == nrec and not saturated:
+                        current[article_id] = record
+                        continue
+
+                    soup = self.get_raw_page(
+                        article_url, parse_only=PTT_BASE.article_strainer
+                    )
+                    comments = (
+                        PTT.parse_comments(soup)
+                        if self.structured_comments
+                        else PTT.get_article_comments(soup)
+                    )
+                    seen_comments = record["comments"] if record else 0
+                    current[article_id] = {"nrec": nrec, "comments": len(comments)}
+                    yield {
+                        "link": article_url,
+                        "article_id": article_url,
+                        "nrec": nrec,
+                        "new_comments": comments[seen_comments:],
+                    }
+                store.set(key, {**known, **current})
+                store.save()
+            completed = True
+        finally:
+            # 中途停止時保留尚未走訪到的紀錄
+            store.set(key, current if completed else {**known, **current})
+            store.save()
+
+    async def aget(
+        self, concurrency: int = 8, ordered: bool = True
+    ) -> AsyncIterator[dict]:
+        """
+        以 asyncio 同時下載多篇文章，用法為 `async for article in ptt.aget()`
+
+        Parameters
+        ----------
+        concurrency : int, optional
+            同時下載的文章數上限, by default 8
+        ordered : bool, optional
+            True 時依索引頁順序回傳（同 `get`），False 時依完成順序回傳, by default True
+
+        Returns
+        -------
+        AsyncIterator[dict]
+            文章資訊，格式同 `get_article_info`
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        tasks = []
+
+        async def fetch(article_url: str) -> dict:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    executor, self.fetch_article, article_url
+                )
+
+        try:
+            article_urls = await loop.run_in_executor(
+                executor, self.get_all_article_urls
+            )
+            tasks = [asyncio.ensure_future(fetch(url)) for url in article_urls]
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False)
+
 
-        for page in range(last_page_number, last_page_number - self.crawler_pages, -1):
-            raw_article_page = self.get_raw_page(PTT.full_url(self.board, page))
-            article_urls.extend(self.get_article_urls(raw_article_page))
+class MultiBoardPTT:
+    def __init__(
+        self,
+        boards: Union[List[str], Dict[str, float]],
+        crawler_pages: int = 5,
+        sleep: Optional[float] = None,
+        client: Optional[HttpClient] = None,
+        structured_comments: bool = False,
+    ) -> None:
+        """
+        同時爬多個看板，所有看板共用同一個連線池與 www.ptt.cc 的 rate limiter
 
-        for article_url in article_urls:
-            raw_content_page = self.get_raw_page(article_url)
-            article_info = self.get_article_info(
-                link=article_url, soup=raw_content_page
+        Parameters
+        ----------
+        boards : Union[List[str], Dict[str, float]]
+            看板代號，或看板代號對應的權重，例如 `{"Stock": 3, "Bank_Service": 1}`，
+            權重越高分到的請求越多
+        crawler_pages : int, optional
+            每個看板要爬幾頁，由最後一頁往前算, by default 5
+        sleep : Optional[float], optional
+            所有看板合計，對 www.ptt.cc 兩次請求之間的平均間隔（秒），None 則沿用
+            client 既有設定（同 `PTT`）, by default None
+        client : Optional[HttpClient], optional
+            共用連線池的 HTTP client，預設使用 `get_default_client()`
+        structured_comments : bool, optional
+            同 `PTT`, by default False
+        """
+        self.weights = boards if isinstance(boards, dict) else dict.fromkeys(boards, 1)
+        self.client = client or get_default_client()
+        self.crawlers = {
+            board: PTT(
+                board,
+                crawler_pages=crawler_pages,
+                sleep=sleep,
+                client=self.client,
+                structured_comments=structured_comments,
             )
-            yield article_info
-            time.sleep(self.sleep)
+            for board in self.weights
+        }
+
+    def pick_board(self, credits: Dict[str, float], candidates: List[str]) -> str:
+        """
+        Smooth weighted round-robin：每次挑選累積權重最高的看板
+
+        Parameters
+        ----------
+        credits : Dict[str, float]
+            每個看板目前累積的權重，會就地更新
+        candidates : List[str]
+            這次可以挑選的看板
+
+        Returns
+        -------
+        str
+            下一個要發出請求的看板
+        """
+        total = 0
+        for board in candidates:
+            credits[board] += self.weights[board]
+            total += self.weights[board]
+        board = max(candidates, key=lambda b: credits[b])
+        credits[board] -= total
+        return board
+
+    def get(self, workers: int = 1) -> Iterator[dict]:
+        """
+        依權重交錯各看板的索引頁與文章請求
+
+        Parameters
+        ----------
+        workers : int, optional
+            同時進行的請求數，每個看板同一時間最多一個請求, by default 1
+
+        Returns
+        -------
+        Iterator[dict]
+            文章資訊，格式同 `PTT.get_article_info`
+        """
+        streams = {board: crawler.get() for board, crawler in self.crawlers.items()}
+        credits = dict.fromkeys(streams, 0.0)
+
+        if workers <= 1:
+            while streams:
+                board = self.pick_board(credits, list(streams))
+                try:
+                    yield next(streams[board])
+                except StopIteration:
+                    del streams[board]
+            return
+
+        result_queue = queue.Queue(maxsize=workers * 2)
+        condition = threading.Condition()
+        busy = set()
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    result_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def work() -> None:
+            while not stop.is_set():
+                with condition:
+                    candidates = [b for b in streams if b not in busy]
+                    if not streams:
+                        break
+                    if not candidates:
+                        condition.wait(timeout=0.1)
+                        continue
+                    board = self.pick_board(credits, candidates)
+                    busy.add(board)
+                try:
+                    put((None, next(streams[board])))
+                except StopIteration:
+                    with condition:
+                        del streams[board]
+                except Exception as e:
+                    put((e, None))
+                finally:
+                    with condition:
+                        busy.discard(board)
+                        condition.notify_all()
+            put(done)
+
+        threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+
+        running = workers
+        try:
+            while running:
+                item = result_queue.get()
+                if item is done:
+                    running -= 1
+                    continue
+                error, article_info = item
+                if error:
+                    raise error
+                yield article_info
+        finally:
+            stop.set()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+BACKOFF_STATUS = (429, 503)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and sleep outside the lock until it becomes
+    available, so concurrent fetchers queue up fairly instead of spinning.
+
+    Attributes
+    ----------
+    base_rate : float
+        Configured requests per second.
+    rate : float
+        Current requests per second, lowered while backing off.
+    burst : int
+        Maximum number of tokens that can accumulate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = 0.05) -> None:
+        """
+        Parameters
+        ----------
+        rate : float
+            Requests per second.
+        burst : int, optional
+            Bucket capacity, by default 1.
+        min_rate : float, optional
+            Lower bound for the rate while backing off, by default 0.05.
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token.
+
+        Returns
+        -------
+        float
+            Seconds the caller has to wait before using the token.
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self, factor: float = 0.5, pause: float = 0.0) -> None:
+        """
+        Slow down after the server asked us to.
+
+        Parameters
+        ----------
+        factor : float, optional
+            Multiplier applied to the current rate, by default 0.5.
+        pause : float, optional
+            Extra seconds during which no token is handed out, e.g. the
+            server's `Retry-After`, by default 0.
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * factor)
+            self.tokens = min(self.tokens, 0.0) - pause * self.rate
+
+    def recover(self, factor: float = 1.1) -> None:
+        """
+        Speed back up towards `base_rate` after a successful response.
+
+        Parameters
+        ----------
+        factor : float, optional
+            Multiplier applied to the current rate, by default 1.1.
+        """
+        if self.rate >= self.base_rate:
+            return
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate * factor)
+
+
+class HostRateLimiter:
+    """
+    Per-host token buckets shared by every crawler using the same client.
+
+    Hosts without an explicit configuration get `default_rate` and
+    `default_burst`. A rate of None disables limiting for that host.
+    """
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = 5.0,
+        default_burst: int = 5,
+        rates: Optional[Dict[str, Tuple[Optional[float], int]]] = None,
+        backoff_factor: float = 0.5,
+        recovery_factor: float = 1.1,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        default_rate : Optional[float], optional
+            Requests per second for unconfigured hosts, by default 5.
+        default_burst : int, optional
+            Burst size for unconfigured hosts, by default 5.
+        rates : Optional[Dict[str, Tuple[Optional[float], int]]], optional
+            Mapping of host name to `(rate, burst)`.
+        backoff_factor : float, optional
+            Rate multiplier applied on 429/503 responses, by default 0.5.
+        recovery_factor : float, optional
+            Rate multiplier applied on every other response until the
+            configured rate is reached again, by default 1.1.
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+        self.buckets: Dict[str, Optional[TokenBucket]] = {}
+        self.lock = threading.Lock()
+        for host, (rate, burst) in (rates or {}).items():
+            self.configure(host, rate, burst)
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the host name of a URL, or the string itself if it is a bare host."""
+        return urlsplit(url).hostname or url
+
+    def configure(self, host: str, rate: Optional[float], burst: int = 1) -> None:
+        """
+        Set the rate of one host.
+
+        Parameters
+        ----------
+        host : str
+            Host name or any URL on that host.
+        rate : Optional[float]
+            Requests per second, or None for no limit.
+        burst : int, optional
+            Bucket capacity, by default 1.
+        """
+        bucket = TokenBucket(rate, burst) if rate else None
+        with self.lock:
+            self.buckets[self.host_of(host)] = bucket
+
+    def setdefault(self, host: str, rate: Optional[float], burst: int = 1) -> None:
+        """
+        Set the rate of one host unless it has already been configured.
+
+        Parameters
+        ----------
+        host : str
+            Host name or any URL on that host.
+        rate : Optional[float]
+            Requests per second, or None for no limit.
+        burst : int, optional
+            Bucket capacity, by default 1.
+        """
+        with self.lock:
+            if self.host_of(host) in self.buckets:
+                return
+        self.configure(host, rate, burst)
+
+    def bucket(self, host: str) -> Optional[TokenBucket]:
+        """Return the bucket of a host, creating it with the defaults if needed."""
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = (
+                    TokenBucket(self.default_rate, self.default_burst)
+                    if self.default_rate
+                    else None
+                )
+            return self.buckets[host]
+
+    def acquire(self, url: str) -> None:
+        """
+        Block until a request to the host of `url` is allowed.
+
+        Parameters
+        ----------
+        url : str
+            URL about to be requested.
+        """
+        bucket = self.bucket(self.host_of(url))
+        if bucket:
+            bucket.acquire()
+
+    def feedback(
+        self, url: str, status_code: int, retry_after: Optional[str] = None
+    ) -> None:
+        """
+        Adjust the host's rate from a response.
+
+        Parameters
+        ----------
+        url : str
+            URL that was requested.
+        status_code : int
+            HTTP status of the response.
+        retry_after : Optional[str], optional
+            Value of the `Retry-After` header, if any.
+        """
+        bucket = self.bucket(self.host_of(url))
+        if not bucket:
+            return
+        if status_code in BACKOFF_STATUS:
+            pause = float(retry_after) if retry_after and retry_after.isdigit() else 0.0
+            bucket.backoff(self.backoff_factor, pause)
+        else:
+            bucket.recover(self.recovery_factor)
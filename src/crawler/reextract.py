@@ -0,0 +1,209 @@
+"""
+Re-run the extractors over a raw-response archive, without network access.
+
+Usage
+-----
+    python -m crawler.reextract ARCHIVE [-o OUTPUT] [--workers N]
+
+ARCHIVE is a file written by `ResponseArchive` while crawling. Every
+archived page is routed to the extractor of its site (`PTT.get_article_info`,
+`UDN.extract_article`, `TVBS.extract_main_data` / `TVBS.extract_article`,
+`FSC.parse_row` / `FSC.extract_content`) in a pool of worker processes, and
+the records are written to OUTPUT (`.jsonl`, `.jsonl.gz`, `.jsonl.zst` or
+`.parquet`). A URL archived by several runs is only extracted from its
+latest response.
+"""
+
+import argparse
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from .archive import iter_archive, to_response
+from .fsc import FSC
+from .parsing import FAST_PARSER, soup_from_response
+from .ptt import PTT, PTT_BASE
+from .sinks import open_sink
+from .tvbs import TVBS
+from .udn import UDN
+
+PTT_ARTICLE = re.compile(r"^/bbs/([^/]+)/M\.[^/]+\.html$")
+ARTICLE_ID = re.compile(r"^(.*/)(\d+)$")
+
+
+def extract_record(
+    record: Dict, structured_comments: bool = False
+) -> Tuple[str, List[Dict]]:
+    """
+    Extract the records of one archived page with the extractor of its site.
+
+    Parameters
+    ----------
+    record : Dict
+        Archived response yielded by `iter_archive`.
+    structured_comments : bool, optional
+        Passed to `PTT`, by default False.
+
+    Returns
+    -------
+    Tuple[str, List[Dict]]
+        The kind of page and its records. "article" records are final,
+        "fsc-listing" rows still miss their content and "fsc-content" records
+        hold only `article_id` and `content`, `reextract` merges the two.
+        Pages no extractor handles (e.g. PTT index pages) give no records.
+    """
+    url = record["url"]
+    parts = urlsplit(url)
+    response = to_response(record)
+
+    if parts.netloc == "www.ptt.cc":
+        match = PTT_ARTICLE.match(parts.path)
+        if not match:
+            return "article", []
+        ptt = PTT(match.group(1), sleep=None, structured_comments=structured_comments)
+        soup = soup_from_response(
+            response, parse_only=PTT_BASE.article_strainer, parser=FAST_PARSER
+        )
+        return "article", [ptt.get_article_info(link=url, soup=soup)]
+
+    if parts.netloc == "www.fsc.gov.tw":
+        fsc = FSC({})
+        soup = soup_from_response(response)
+        # Article and listing URLs share one path, tell them apart by content
+        if soup.find("div", class_="page-edit"):
+            content = fsc.extract_content(soup)
+            return "fsc-content", [{"article_id": url, "content": content}]
+        category = record.get("meta", {}).get("category")
+        rows = [fsc.parse_row(row, category) for row in soup.find_all("li", role="row")]
+        return "fsc-listing", [row for row in rows if row]
+
+    match = ARTICLE_ID.match(url)
+    if not match:
+        return "article", []
+    start_url, article_id = match.group(1), int(match.group(2))
+
+    if parts.netloc == "news.tvbs.com.tw":
+        tvbs = TVBS(0, start_url, start_id=article_id)
+        main_data = tvbs.extract_main_data(response.content)
+        if not main_data or tvbs.is_other_section(main_data, article_id):
+            return "article", []
+        return "article", [tvbs.extract_article(main_data, url)]
+
+    if parts.netloc == "udn.com":
+        udn = UDN(0, start_url, start_id=article_id)
+        soup = soup_from_response(response)
+        if udn.is_other_section(soup, article_id):
+            return "article", []
+        article = udn.extract_article(soup, url)
+        return "article", [article] if article else []
+
+    return "article", []
+
+
+def extract_chunk(records: List[Dict]) -> List[Tuple[str, List[Dict]]]:
+    """
+    Run `extract_record` over a chunk of archived pages in a worker process.
+
+    Parameters
+    ----------
+    records : List[Dict]
+        Archived responses yielded by `iter_archive`.
+
+    Returns
+    -------
+    List[Tuple[str, List[Dict]]]
+        The result of `extract_record` for each page.
+    """
+    return [extract_record(record) for record in records]
+
+
+def reextract(
+    records: Iterable[Dict], workers: Optional[int] = None, chunksize: int = 16
+) -> Iterator[Dict]:
+    """
+    Run `extract_record` over archived pages in a process pool.
+
+    Records are yielded in archive order. FSC listing rows are held back
+    until the end, when the contents of the archived FSC article pages are
+    merged into them, FSC article pages without an archived listing row are
+    skipped. The archive is read lazily, only a few chunks per worker are
+    decoded and waiting in the pool at any time.
+
+    Parameters
+    ----------
+    records : Iterable[Dict]
+        Archived responses yielded by `iter_archive`.
+    workers : Optional[int], optional
+        Number of worker processes, by default the number of CPUs.
+    chunksize : int, optional
+        Pages sent to a worker at once, by default 16.
+
+    Returns
+    -------
+    Iterator[Dict]
+        Extracted records.
+    """
+    fsc_rows: Dict[str, Dict] = {}
+    fsc_contents: Dict[str, str] = {}
+    records = (record for record in records if record["status"] == 200)
+    # Chunks waiting for or running in the pool, bounds the memory used
+    max_chunks = 2 * (workers or os.cpu_count() or 1)
+    chunks: Deque = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                while len(chunks) < max_chunks:
+                    chunk = list(islice(records, chunksize))
+                    if not chunk:
+                        break
+                    chunks.append(executor.submit(extract_chunk, chunk))
+                if not chunks:
+                    break
+                for kind, results in chunks.popleft().result():
+                    for result in results:
+                        if kind == "fsc-listing":
+                            fsc_rows[result["article_id"]] = result
+                        elif kind == "fsc-content":
+                            fsc_contents[result["article_id"]] = result["content"]
+                        else:
+                            yield result
+        finally:
+            for future in chunks:
+                future.cancel()
+
+    for article_id, row in fsc_rows.items():
+        row["content"] = fsc_contents.pop(article_id, None)
+        yield row
+    if fsc_contents:
+        print(f"Skipped {len(fsc_contents)} FSC articles without an archived listing")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m crawler.reextract",
+        description="Re-run the extractors over a raw-response archive.",
+    )
+    parser.add_argument("archive", help="archive written by ResponseArchive")
+    parser.add_argument(
+        "-o", "--output", default="reextracted.jsonl", help="output file"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    args = parser.parse_args()
+
+    with open_sink(args.output) as sink:
+        written = sink.write_all(
+            reextract(
+                iter_archive(args.archive, latest_only=True), workers=args.workers
+            )
+        )
+    print(f"Re-extracted {written} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+import gzip
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class Sink(ABC):
+    """
+    Base class of the output sinks.
+
+    Records are buffered and written in batches, either when `batch_size`
+    records are pending or when `flush_interval` seconds have passed since the
+    last flush, so output starts while the crawl is still running.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 5.0) -> None:
+        """
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of buffered records that triggers a flush, by default 100.
+        flush_interval : float, optional
+            Maximum seconds between flushes while records keep arriving,
+            by default 5.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer: List[Dict] = []
+        self.last_flush = time.monotonic()
+
+    def write(self, record: Dict) -> None:
+        """
+        Buffer one record, flushing when the batch is full or due.
+
+        Parameters
+        ----------
+        record : Dict
+            Record yielded by a crawler.
+        """
+        self.buffer.append(record)
+        if (
+            len(self.buffer) >= self.batch_size
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def write_all(self, records: Iterable[Dict]) -> int:
+        """
+        Write every record of an iterable, e.g. `sink.write_all(ptt.get())`.
+
+        Parameters
+        ----------
+        records : Iterable[Dict]
+            Records yielded by a crawler.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def flush(self) -> None:
+        """Write the buffered records."""
+        if self.buffer:
+            self._write_batch(self.buffer)
+            self.buffer = []
+        self.last_flush = time.monotonic()
+
+    @abstractmethod
+    def _write_batch(self, records: List[Dict]) -> None:
+        """
+        Write one batch of records, implemented by every sink.
+
+        Parameters
+        ----------
+        records : List[Dict]
+            The buffered records, in the order they were written.
+        """
+
+    def close(self) -> None:
+        """Flush the remaining records and release the file."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JsonlSink(Sink):
+    """
+    Append records to a JSON Lines file, optionally gzip or zstd compressed.
+
+    Every batch is written with a single `write` call and fsynced. A
+    compressed batch is a self-contained gzip member or zstd frame, and both
+    formats allow concatenation, so later runs can append to the same file.
+    A partial last line left by a crashed plain-text run is dropped before
+    appending.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: Optional[str] = None,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Output file, created if needed and appended to otherwise.
+        compression : Optional[str], optional
+            None, "gzip" or "zstd" (requires `zstandard`), by default None.
+        batch_size : int, optional
+            Number of buffered records that triggers a flush, by default 100.
+        flush_interval : float, optional
+            Maximum seconds between flushes, by default 5.
+        """
+        super().__init__(batch_size, flush_interval)
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.path = Path(path)
+        self.compression = compression
+        self.compressor = None
+        if compression == "zstd":
+            import zstandard
+
+            self.compressor = zstandard.ZstdCompressor()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if compression is None:
+            self._drop_partial_line()
+        self.file = open(self.path, "ab")
+
+    def _drop_partial_line(self) -> None:
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            # Scan backwards for the last complete line
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                index = f.read(end - start).rfind(b"\n")
+                if index >= 0:
+                    f.truncate(start + index + 1)
+                    return
+                end = start
+            f.truncate(0)
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in records
+        ).encode("utf-8")
+        if self.compression == "gzip":
+            data = gzip.compress(data)
+        elif self.compression == "zstd":
+            data = self.compressor.compress(data)
+        self.file.write(data)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        """Flush the remaining records and close the file."""
+        super().close()
+        self.file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Write records to Parquet files with pyarrow, one row group per batch.
+
+    Parquet files cannot be appended to, so `path` is a directory and every
+    run writes a new `part-<timestamp>.parquet` file into it. Unless a
+    `schema` is given it is inferred from the first batch, with columns that
+    are None in every record of that batch (e.g. a missing UDN subtitle)
+    typed as strings instead of null.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 1000,
+        flush_interval: float = 30.0,
+        schema: Optional["pyarrow.Schema"] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Output directory, created if needed.
+        batch_size : int, optional
+            Number of records per row group, by default 1000.
+        flush_interval : float, optional
+            Maximum seconds between flushes, by default 30.
+        schema : Optional[pyarrow.Schema], optional
+            Schema of the records, by default inferred from the first batch.
+            Needed when a nested column, e.g. PTT structured comments, can
+            be an empty list in the whole first batch.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        super().__init__(batch_size, flush_interval)
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.file_path = (
+            self.path / f"part-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.parquet"
+        )
+        self.schema = schema
+        self.writer = None
+
+    def _string_if_null(self, data_type):
+        """Replace the null type, also inside lists and structs, by string."""
+        if self.pa.types.is_null(data_type):
+            return self.pa.string()
+        if self.pa.types.is_list(data_type):
+            return self.pa.list_(self._string_if_null(data_type.value_type))
+        if self.pa.types.is_struct(data_type):
+            return self.pa.struct(
+                [
+                    field.with_type(self._string_if_null(field.type))
+                    for field in data_type
+                ]
+            )
+        return data_type
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        if self.writer is None:
+            schema = self.schema
+            if schema is None:
+                inferred = self.pa.Table.from_pylist(records).schema
+                schema = self.pa.schema(
+                    [
+                        field.with_type(self._string_if_null(field.type))
+                        for field in inferred
+                    ]
+                )
+            self.writer = self.pq.ParquetWriter(self.file_path, schema)
+        table = self.pa.Table.from_pylist(records, schema=self.writer.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        """Flush the remaining records and finalize the Parquet file."""
+        super().close()
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_sink(path: Union[str, Path], **kwargs) -> Sink:
+    """
+    Open a sink chosen by the file extension.
+
+    `.jsonl` → plain JSON Lines, `.jsonl.gz` → gzip, `.jsonl.zst` → zstd,
+    `.parquet` → a directory of Parquet files.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Output path.
+    **kwargs
+        Forwarded to the sink, e.g. `batch_size` or `flush_interval`.
+
+    Returns
+    -------
+    Sink
+        The opened sink, usable as a context manager.
+    """
+    name = str(path)
+    if name.endswith(".parquet"):
+        return ParquetSink(path, **kwargs)
+    if name.endswith(".gz"):
+        return JsonlSink(path, compression="gzip", **kwargs)
+    if name.endswith(".zst"):
+        return JsonlSink(path, compression="zstd", **kwargs)
+    return JsonlSink(path, **kwargs)
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+
+class JsonStore:
+    """
+    Small key/value store persisted as one JSON file.
+
+    Used for crawler state that has to survive between runs, such as PTT
+    watermarks. Values must be JSON serializable; `save` writes atomically so
+    an interrupted run never leaves a truncated file behind.
+
+    Attributes
+    ----------
+    path : Path
+        Location of the JSON file.
+    data : dict
+        The loaded state.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Load the store, or start empty if the file does not exist yet.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Location of the JSON file.
+        """
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.data = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Parameters
+        ----------
+        key : str
+            Key to look up.
+        default : Any, optional
+            Value returned when the key is missing, by default None.
+
+        Returns
+        -------
+        Any
+            The stored value.
+        """
+        with self.lock:
+            return self.data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Parameters
+        ----------
+        key : str
+            Key to store.
+        value : Any
+            JSON serializable value.
+        """
+        with self.lock:
+            self.data[key] = value
+
+    def save(self) -> None:
+        """Write the store to disk atomically."""
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,198 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from .archive import ResponseArchive
+from .cache import HttpCache
+from .ratelimit import HostRateLimiter
+
+DEFAULT_HEADERS = {
+    "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+}
+DEFAULT_TIMEOUT = 10.0
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP client shared by every crawler.
+
+    Each host gets its own urllib3 connection pool, so consecutive requests to
+    the same site reuse the TCP/TLS connection instead of paying a fresh
+    handshake per article.
+
+    Attributes
+    ----------
+    session : requests.Session
+        The underlying session holding the connection pools.
+    timeout : float
+        Default timeout (seconds) applied to every request.
+    rate_limiter : HostRateLimiter
+        Per-host politeness budget applied before every request.
+    cache : Optional[HttpCache]
+        On-disk cache consulted before every request, None to disable.
+    archive : Optional[ResponseArchive]
+        Archive every 200 response is appended to, None to disable.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 0,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        archive: Optional[ResponseArchive] = None,
+    ) -> None:
+        """
+        Initialize the HTTP client.
+
+        Parameters
+        ----------
+        pool_connections : int, optional
+            Number of per-host connection pools to keep, by default 10.
+        pool_maxsize : int, optional
+            Maximum number of keep-alive connections per host, by default 10.
+        headers : Optional[Dict[str, str]], optional
+            Headers sent with every request, merged over `DEFAULT_HEADERS`.
+        timeout : float, optional
+            Default request timeout in seconds, by default 10.
+        max_retries : int, optional
+            Connection-level retries handled by the adapter, by default 0.
+        rate_limiter : Optional[HostRateLimiter], optional
+            Per-host rate limiter, by default a new `HostRateLimiter()`.
+        cache : Optional[HttpCache], optional
+            On-disk HTTP cache, by default None (no caching).
+        archive : Optional[ResponseArchive], optional
+            Raw-response archive for offline re-extraction, by default None.
+        """
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache = cache
+        self.archive = archive
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(
+        self, url: str, archive_meta: Optional[Dict] = None, **kwargs
+    ) -> requests.Response:
+        """
+        Send a GET request through the pooled session.
+
+        The call blocks until the host's rate limiter allows it, and 429/503
+        responses make the limiter back off for that host. With a `cache`, a
+        fresh cached page is returned without a request and a stale one is
+        revalidated with a conditional GET. With an `archive`, every 200
+        response downloaded from the server is also appended to it, pages
+        served from the cache are not archived again.
+
+        Parameters
+        ----------
+        url : str
+            URL to fetch.
+        archive_meta : Optional[Dict], optional
+            Stored with the response in the `archive`, by default None.
+        **kwargs
+            Extra arguments forwarded to `requests.Session.get`.
+
+        Returns
+        -------
+        requests.Response
+            The response object.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        response = self._fetch(url, **kwargs)
+        if (
+            self.archive is not None
+            and response.status_code == 200
+            and not kwargs.get("stream")
+            and not getattr(response, "from_cache", False)
+        ):
+            self.archive.record(url, response, archive_meta)
+        return response
+
+    def _fetch(self, url: str, **kwargs) -> requests.Response:
+        cache = self.cache
+        if cache is not None and ("params" in kwargs or kwargs.get("stream")):
+            cache = None
+        cached = cache.lookup(url) if cache is not None else None
+        if cached:
+            meta, body, fresh = cached
+            if fresh:
+                return cache.build_response(meta, body)
+            kwargs["headers"] = {
+                **cache.validators(meta),
+                **(kwargs.get("headers") or {}),
+            }
+
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, **kwargs)
+        self.rate_limiter.feedback(
+            url, response.status_code, response.headers.get("Retry-After")
+        )
+
+        if cache is not None:
+            if cached and response.status_code == 304:
+                cache.touch(url)
+                return cache.build_response(meta, body)
+            cache.store(url, response)
+            response.from_cache = False
+        return response
+
+    def close(self) -> None:
+        """Close every pooled connection and flush the archive."""
+        self.session.close()
+        if self.archive is not None:
+            self.archive.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """
+    Return the process-wide client used when a crawler is not given one.
+
+    Returns
+    -------
+    HttpClient
+        The shared client, created on first use.
+    """
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
+
+def set_default_client(client: HttpClient) -> None:
+    """
+    Replace the process-wide client.
+
+    Parameters
+    ----------
+    client : HttpClient
+        Client to share between crawlers created afterwards.
+    """
+    global _default_client
+    with _default_lock:
+        _default_client = client
@@ -1,9 +1,27 @@
 import requests
 from bs4 import BeautifulSoup
-import time
 import json
 import re
-from typing import Optional, List, Dict
+from typing import Optional, Iterator, List, Dict
+from urllib.parse import urlsplit
+from .discovery import NegativeCache, latest_id_from_listing, probe_latest_id
+from .parsing import make_soup
+from .sinks import open_sink
+from .store import JsonStore
+from .transport import HttpClient, get_default_client
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+LD_JSON_SCRIPT = re.compile(
+    rb"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+CONTROL_CHARACTERS = bytes(range(0x20)) + b"\x7f"
 
 
 class TVBS:
@@ -16,13 +34,22 @@ class TVBS:
         Number of articles to scrape.
     start_url : str
         Base URL to start scraping from.
-    start_id : int
-        The ID of the latest article to start scraping from.
+    start_id : Optional[int]
+        The ID of the latest article to start scraping from, discovered
+        automatically when None.
     article_list : list
         A list to store all the scraped article information.
     """
 
-    def __init__(self, page: int, start_url: str, start_id: int) -> None:
+    def __init__(
+        self,
+        page: int,
+        start_url: str,
+        start_id: Optional[int] = None,
+        client: Optional[HttpClient] = None,
+        listing_url: Optional[str] = None,
+        store: Optional[JsonStore] = None,
+    ) -> None:
         """
         Initializes the TVBS crawler with the number of articles to scrape, start URL, and article ID.
 
@@ -32,13 +59,27 @@ class TVBS:
             Number of articles to scrape.
         start_url : str
             The base URL for scraping.
-        start_id : int
-            The latest article ID to start scraping from.
+        start_id : Optional[int], optional
+            The latest article ID to start scraping from, by default None
+            (discovered with `discover_latest_id`).
+        client : Optional[HttpClient], optional
+            Shared HTTP client, by default `get_default_client()`.
+        listing_url : Optional[str], optional
+            Section listing page used to discover the latest article ID,
+            by default `start_url` without the trailing slash.
+        store : Optional[JsonStore], optional
+            Store for the negative cache of IDs that were empty or belong to
+            another section, by default None (no cache).
         """
         self.page = page
         self.start_url = start_url
         self.start_id = start_id
+        self.listing_url = listing_url or start_url.rstrip("/")
+        self.store = store
         self.article_list = []
+        self.client = client or get_default_client()
+        # Politeness budget shared by every crawler hitting the same host
+        self.client.rate_limiter.setdefault(start_url, 5, 1)
 
     def fetch_data(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -55,14 +96,64 @@ class TVBS:
             Parsed BeautifulSoup object, or None if there's an error.
         """
         try:
-            response = requests.get(url)
-            response.encoding = "utf-8"  # Set response encoding to UTF-8
-            soup = BeautifulSoup(response.text, "html.parser")
-            return soup
+            response = self.client.get(url)
+            response.raise_for_status()
+            # TVBS always serves UTF-8, decode the bytes once
+            return make_soup(response.content, from_encoding="utf-8")
+        except requests.RequestException as e:
+            print(f"Error fetching data from {url}: {e}")
+            return None
+
+    def fetch_raw(self, url: str) -> Optional[bytes]:
+        """
+        Fetch the raw bytes of a page without building a DOM.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the article to fetch.
+
+        Returns
+        -------
+        Optional[bytes]
+            The response body, or None if there's an error or the status is
+            not successful.
+        """
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+            return response.content
         except requests.RequestException as e:
             print(f"Error fetching data from {url}: {e}")
             return None
 
+    def extract_main_data(self, content: bytes) -> Optional[Dict]:
+        """
+        Extract the main data straight from the response bytes.
+
+        The ld+json block is located with a single regex scan, control
+        characters are dropped with `bytes.translate` and the JSON is decoded
+        with orjson when it is installed. Falls back to `get_main_data` on a
+        parsed page only if the fast scan fails.
+
+        Parameters
+        ----------
+        content : bytes
+            The raw HTML of the article page.
+
+        Returns
+        -------
+        Optional[Dict]
+            The decoded JSON data containing the article's details, or None if decoding fails.
+        """
+        match = LD_JSON_SCRIPT.search(content)
+        if match:
+            try:
+                return json_loads(match.group(1).translate(None, CONTROL_CHARACTERS))
+            except ValueError:
+                pass
+        return self.get_main_data(make_soup(content, from_encoding="utf-8"))
+
     def get_main_data(self, soup: BeautifulSoup) -> Optional[Dict]:
         """
         Extract and decode the main data of the article from the soup object.
@@ -89,6 +180,79 @@ class TVBS:
                 return None
         return None
 
+    def article_exists(self, article_id: int) -> bool:
+        """
+        Check whether an article ID resolves to an article.
+
+        Parameters
+        ----------
+        article_id : int
+            The article ID to check.
+
+        Returns
+        -------
+        bool
+            True if the page has article data.
+        """
+        content = self.fetch_raw(self.start_url + str(article_id))
+        return bool(content and self.extract_main_data(content))
+
+    def discover_latest_id(self, probe: bool = False) -> int:
+        """
+        Find the latest article ID from the section listing page.
+
+        Parameters
+        ----------
+        probe : bool, optional
+            Also probe upward from the listing result (or from `start_id` when
+            the listing has no links) with exponential/binary search, by
+            default False.
+
+        Returns
+        -------
+        int
+            The latest article ID.
+        """
+        latest_id = None
+        try:
+            response = self.client.get(self.listing_url)
+            latest_id = latest_id_from_listing(response.text, self.start_url)
+        except requests.RequestException as e:
+            print(f"Error fetching listing page {self.listing_url}: {e}")
+
+        if latest_id is None:
+            if self.start_id is None:
+                raise ValueError(
+                    f"No article links found on {self.listing_url}, pass start_id"
+                )
+            latest_id, probe = self.start_id, True
+        if probe:
+            latest_id = probe_latest_id(self.article_exists, latest_id)
+        return latest_id
+
+    def is_other_section(self, main_data: Dict, article_id: int) -> bool:
+        """
+        Check whether the article data points to this article in another section.
+
+        Parameters
+        ----------
+        main_data : dict
+            The decoded data containing the article's details.
+        article_id : int
+            The requested article ID.
+
+        Returns
+        -------
+        bool
+            True if the canonical URL of the article is outside `start_url`.
+        """
+        url = main_data.get("url") or main_data.get("mainEntityOfPage")
+        if isinstance(url, dict):
+            url = url.get("@id")
+        if not isinstance(url, str) or not url.rstrip("/").endswith(f"/{article_id}"):
+            return False
+        return urlsplit(url).path != urlsplit(self.start_url + str(article_id)).path
+
     def get_title(self, main_data: Dict) -> str:
         """
         Extract the article title from the main data.
@@ -159,6 +323,74 @@ class TVBS:
         """
         return main_data.get("articleBody", "No content available")[:-19]
 
+    def extract_article(self, main_data: Dict, article_url: str) -> Dict:
+        """
+        Build the article information from its main data.
+
+        Parameters
+        ----------
+        main_data : Dict
+            The decoded ld+json data of the article.
+        article_url : str
+            URL of the article.
+
+        Returns
+        -------
+        Dict
+            Article information.
+        """
+        title = self.get_title(main_data)
+        datetime = self.get_datetime(main_data)
+        link = self.get_link(article_url)
+        content = self.get_content(main_data)
+        month = datetime[:-3]
+
+        return {
+            "title": title,
+            "date": datetime if datetime != "未知日期" else None,
+            "month": month,
+            "article_id": link,
+            "content": content,
+        }
+
+    def iter_info(self) -> Iterator[Dict]:
+        """
+        Scrape articles one by one, yielding each as soon as it is extracted.
+
+        Returns
+        -------
+        Iterator[Dict]
+            Dictionaries containing information for one article.
+        """
+        start_id = self.start_id or self.discover_latest_id() + 1
+        misses = (
+            NegativeCache(self.store, f"tvbs-misses/{self.start_url}")
+            if self.store
+            else set()
+        )
+
+        try:
+            for i in range(start_id - self.page, start_id):
+                if i in misses:
+                    continue
+                article_url = self.start_url + str(i)
+                content = self.fetch_raw(article_url)
+                if content:
+                    main_data = self.extract_main_data(content)
+                    if main_data and self.is_other_section(main_data, i):
+                        print(f"Skipping {article_url}, it belongs to another section")
+                        misses.add(i)
+                    elif main_data:
+                        yield self.extract_article(main_data, article_url)
+                    else:
+                        print(f"Failed to extract main data from {article_url}")
+                        misses.add(i)
+                else:
+                    print(f"Failed to fetch data from {article_url}")
+        finally:
+            if self.store:
+                misses.save()
+
     def get_info(self) -> List[Dict]:
         """
         Scrape article information including title, publication date, link, and content.
@@ -168,35 +400,8 @@ class TVBS:
         List[Dict]
             A list of dictionaries, each containing information for one article.
         """
-        for i in range(self.start_id - self.page, self.start_id):
-            article_url = self.start_url + str(i)
-            soup = self.fetch_data(article_url)
-            if soup:
-                main_data = self.get_main_data(soup)
-                if main_data:
-                    # Extract necessary information
-                    title = self.get_title(main_data)
-                    datetime = self.get_datetime(main_data)
-                    link = self.get_link(article_url)
-                    content = self.get_content(main_data)
-                    month = datetime[:-3]
-
-                    # Store article information
-                    article_info = {
-                        "title": title,
-                        "date": datetime if datetime != "未知日期" else None,
-                        "month": month,
-                        "article_id": link,
-                        "content": content,
-                    }
-
-                    self.article_list.append(article_info)
-                else:
-                    print(f"Failed to extract main data from {article_url}")
-            else:
-                print(f"Failed to fetch data from {article_url}")
-
-            time.sleep(0.2)  # Add delay to prevent rate-limiting or server overload
+        for article_info in self.iter_info():
+            self.article_list.append(article_info)
         return self.article_list
 
 
@@ -204,6 +409,6 @@ if __name__ == "__main__":
     # Example usage
     tvbs = TVBS(1000, "https://news.tvbs.com.tw/money/", 2628359)
 
-    # Write the scraped data to a JSON file
-    with open("articles_tvbs.json", "w", encoding="utf-8") as f:
-        json.dump(tvbs.get_info(), f, ensure_ascii=False, indent=4)
+    # Stream the scraped data to a JSON Lines file
+    with open_sink("articles_tvbs.jsonl") as sink:
+        sink.write_all(tvbs.iter_info())
@@ -1,8 +1,12 @@
 import requests
 from bs4 import BeautifulSoup
-import time
-import json
-from typing import Optional, List, Dict
+from typing import Optional, Iterator, List, Dict
+from urllib.parse import urlsplit
+from .discovery import NegativeCache, latest_id_from_listing, probe_latest_id
+from .parsing import soup_from_response
+from .sinks import open_sink
+from .store import JsonStore
+from .transport import HttpClient, get_default_client
 
 
 class UDN:
@@ -15,13 +19,22 @@ class UDN:
         Number of articles to scrape.
     start_url : str
         Base URL of the news section.
-    start_id : int
-        ID of the latest article to start scraping from.
+    start_id : Optional[int]
+        ID of the latest article to start scraping from, discovered
+        automatically when None.
     article_list : List[Dict]
         List to store scraped articles.
     """
 
-    def __init__(self, page: int, start_url: str, start_id: int) -> None:
+    def __init__(
+        self,
+        page: int,
+        start_url: str,
+        start_id: Optional[int] = None,
+        client: Optional[HttpClient] = None,
+        listing_url: Optional[str] = None,
+        store: Optional[JsonStore] = None,
+    ) -> None:
         """
         Initialize the UDN Crawler.
 
@@ -31,13 +44,27 @@ class UDN:
             Number of articles to scrape.
         start_url : str
             Base URL for scraping.
-        start_id : int
-            ID of the latest article to start scraping from.
+        start_id : Optional[int], optional
+            ID of the latest article to start scraping from, by default None
+            (discovered with `discover_latest_id`).
+        client : Optional[HttpClient], optional
+            Shared HTTP client, by default `get_default_client()`.
+        listing_url : Optional[str], optional
+            Section listing page linking to the newest articles, used to
+            discover the latest ID, by default None.
+        store : Optional[JsonStore], optional
+            Store for the negative cache of IDs that were empty or belong to
+            another section, by default None (no cache).
         """
         self.page = page
         self.start_url = start_url
         self.start_id = start_id
+        self.listing_url = listing_url
+        self.store = store
         self.article_list: List[Dict] = []
+        self.client = client or get_default_client()
+        # Politeness budget shared by every crawler hitting the same host
+        self.client.rate_limiter.setdefault(start_url, 10, 1)
 
     def fetch_data(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -54,13 +81,90 @@ class UDN:
             Parsed HTML page as BeautifulSoup object, or None if request fails.
         """
         try:
-            response = requests.get(url)
+            response = self.client.get(url)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            return soup_from_response(response)
         except requests.RequestException as e:
             print(f"Error fetching data from {url}: {e}")
             return None
 
+    def article_exists(self, article_id: int) -> bool:
+        """
+        Check whether an article ID resolves to an article.
+
+        Parameters
+        ----------
+        article_id : int
+            The article ID to check.
+
+        Returns
+        -------
+        bool
+            True if the page has an article title.
+        """
+        soup = self.fetch_data(self.start_url + str(article_id))
+        return bool(soup and self.get_title(soup))
+
+    def discover_latest_id(self, probe: bool = False) -> int:
+        """
+        Find the latest article ID from `listing_url`, or by probing upward
+        from `start_id` when no listing page is available.
+
+        Parameters
+        ----------
+        probe : bool, optional
+            Also probe upward from the listing result with exponential/binary
+            search, by default False.
+
+        Returns
+        -------
+        int
+            The latest article ID.
+        """
+        latest_id = None
+        if self.listing_url:
+            try:
+                response = self.client.get(self.listing_url)
+                latest_id = latest_id_from_listing(response.text, self.start_url)
+            except requests.RequestException as e:
+                print(f"Error fetching listing page {self.listing_url}: {e}")
+
+        if latest_id is None:
+            if self.start_id is None:
+                raise ValueError(
+                    "No listing_url result to discover from, pass start_id"
+                )
+            latest_id, probe = self.start_id, True
+        if probe:
+            latest_id = probe_latest_id(self.article_exists, latest_id)
+        return latest_id
+
+    def is_other_section(self, soup: BeautifulSoup, article_id: int) -> bool:
+        """
+        Check whether the page is this article in another section.
+
+        Parameters
+        ----------
+        soup : BeautifulSoup
+            Parsed HTML page.
+        article_id : int
+            The requested article ID.
+
+        Returns
+        -------
+        bool
+            True if the canonical URL of the article is outside `start_url`.
+        """
+        canonical_tag = soup.find("link", rel="canonical") or soup.find(
+            "meta", {"property": "og:url"}
+        )
+        if not canonical_tag:
+            return False
+        url = canonical_tag.get("href") or canonical_tag.get("content") or ""
+        if f"/{article_id}" not in url:
+            return False
+        return urlsplit(self.start_url).path not in urlsplit(url).path
+
     def get_content(self, soup: BeautifulSoup) -> Optional[str]:
         """
         Extract the main content of the article, excluding <a> tags.
@@ -165,6 +269,127 @@ class UDN:
         title_tag = soup.find("h1")
         return title_tag.text.strip() if title_tag else None
 
+    def extract_article(self, soup: BeautifulSoup, article_url: str) -> Optional[Dict]:
+        """
+        Extract the information of one article page.
+
+        Parameters
+        ----------
+        soup : BeautifulSoup
+            Parsed article page.
+        article_url : str
+            URL of the article.
+
+        Returns
+        -------
+        Optional[Dict]
+            Article information, or None if the title or content is missing.
+        """
+        category = self.get_category(soup)
+        title = self.get_title(soup)
+        datetime = self.get_datetime(soup)
+        content = self.get_content(soup)
+        subtitle = self.get_subtitle(soup)
+        month = datetime[:-3] if datetime else None
+
+        if not title or not content:
+            print(f"Skipping article ID {article_url} due to missing title or content.")
+            return None
+
+        return {
+            "category": category,
+            "subtitle": subtitle,
+            "title": title,
+            "date": datetime if datetime != "未知日期" else None,
+            "month": month,
+            "article_id": article_url,
+            "content": content,
+        }
+
+    def iter_info(self) -> Iterator[Dict]:
+        """
+        Loop through articles, yielding each one as soon as it is extracted.
+
+        Returns
+        -------
+        Iterator[Dict]
+            Dictionaries containing article information.
+        """
+        start_id = self.start_id or self.discover_latest_id() + 1
+        misses = (
+            NegativeCache(self.store, f"udn-misses/{self.start_url}")
+            if self.store
+            else set()
+        )
+
+        try:
+            for i in range(start_id - self.page, start_id):
+                if i in misses:
+                    continue
+                article_url = self.start_url + str(i)
+                soup = self.fetch_data(article_url)
+
+                if soup:
+                    if self.is_other_section(soup, i):
+                        print(f"Skipping {article_url}, it belongs to another section")
+                        misses.add(i)
+                        continue
+
+                    article_content = self.extract_article(soup, article_url)
+                    if article_content is None:
+                        misses.add(i)
+                        continue  # Skip articles with missing title or content
+
+                    yield article_content
+        finally:
+            if self.store:
+                misses.save()
+
+    def process_pipeline(
+        self,
+        fetch_workers: int = 8,
+        processes: Optional[int] = None,
+        chunk_size: int = 16,
+    ) -> Iterator[Dict]:
+        """
+        Crawl the same articles as `iter_info`, fetching raw pages with threads
+        and extracting them in a process pool so parsing uses every core.
+
+        Parameters
+        ----------
+        fetch_workers : int, optional
+            Number of fetch threads, by default 8.
+        processes : Optional[int], optional
+            Number of extraction processes, by default the number of CPUs.
+        chunk_size : int, optional
+            Pages sent to an extraction process at once, by default 16.
+
+        Returns
+        -------
+        Iterator[Dict]
+            Dictionaries containing article information, in ID order.
+        """
+        from .pipeline import ProcessPipeline
+
+        start_id = self.start_id or self.discover_latest_id() + 1
+        misses = (
+            NegativeCache(self.store, f"udn-misses/{self.start_url}")
+            if self.store
+            else set()
+        )
+        urls = (
+            self.start_url + str(i)
+            for i in range(start_id - self.page, start_id)
+            if i not in misses
+        )
+        with ProcessPipeline(
+            self.client,
+            fetch_workers=fetch_workers,
+            processes=processes,
+            chunk_size=chunk_size,
+        ) as pipeline:
+            yield from pipeline.run(urls)
+
     def get_info(self) -> List[Dict]:
         """
         Loop through articles and extract relevant information.
@@ -174,37 +399,8 @@ class UDN:
         List[Dict]
             List of dictionaries containing article information.
         """
-        for i in range(self.start_id - self.page, self.start_id):
-            article_url = self.start_url + str(i)
-            soup = self.fetch_data(article_url)
-
-            if soup:
-                category = self.get_category(soup)
-                title = self.get_title(soup)
-                datetime = self.get_datetime(soup)
-                link = article_url
-                content = self.get_content(soup)
-                subtitle = self.get_subtitle(soup)
-                month = datetime[:-3] if datetime else None
-
-                if not title or not content:
-                    print(
-                        f"Skipping article ID {article_url} due to missing title or content."
-                    )
-                    continue  # Skip articles with missing title or content
-
-                article_content = {
-                    "category": category,
-                    "subtitle": subtitle,
-                    "title": title,
-                    "date": datetime if datetime != "未知日期" else None,
-                    "month": month,
-                    "article_id": link,
-                    "content": content,
-                }
-
-                self.article_list.append(article_content)
-            time.sleep(0.1)  # Add delay to prevent overloading the server
+        for article_content in self.iter_info():
+            self.article_list.append(article_content)
 
         return self.article_list
 
@@ -212,7 +408,6 @@ class UDN:
 # Example usage
 if __name__ == "__main__":
     udn = UDN(1000, "https://udn.com/news/story/124222/", 8243941)  # Scrape 10 articles
-    articles = udn.get_info()
-    # Print results as formatted JSON
-    with open("udn.json", "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=4)
+    # Stream results to a JSON Lines file as they are scraped
+    with open_sink("udn.jsonl") as sink:
+        sink.write_all(udn.iter_info())